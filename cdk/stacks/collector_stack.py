@@ -152,6 +152,7 @@ class CollectorStack(Stack):
             ),
             timeout=Duration.minutes(5),
             memory_size=512,
+            logging_format=lambda_.LoggingFormat.JSON,
             environment={
                 "TABLE_NAME": table.table_name,
                 "CONFIG_BUCKET": config_bucket.bucket_name,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -61,11 +62,11 @@ def build_daily_summary(
     latest = max(snapshots, key=lambda s: s.hour)
 
     # Calculate top 5 services
-    top_services = sorted(
+    top_services = heapq.nlargest(
+        5,
         latest.cost_by_service.items(),
         key=lambda x: x[1],
-        reverse=True,
-    )[:5]
+    )
 
     # Calculate trend (compare to 7-day average)
     trend = _calculate_trend(storage, latest)
@@ -204,11 +205,11 @@ def build_weekly_summary(
         week_over_week_change = ((week_total - prev_week_total) / prev_week_total) * 100
 
     # Top 5 services for the week
-    top_services = sorted(
+    top_services = heapq.nlargest(
+        5,
         service_totals.items(),
         key=lambda x: x[1],
-        reverse=True,
-    )[:5]
+    )
 
     # Budget info
     budget_percent = 0.0
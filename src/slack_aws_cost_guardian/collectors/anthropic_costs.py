@@ -7,8 +7,10 @@ See: https://platform.claude.com/docs/en/build-with-claude/usage-cost-api
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 
 import httpx
 
@@ -24,6 +26,54 @@ ANTHROPIC_COST_API_URL = "https://api.anthropic.com/v1/organizations/cost_report
 ANTHROPIC_API_VERSION = "2023-06-01"
 
 
+def iter_cost_report_pages(
+    client: httpx.Client,
+    admin_api_key: str,
+    start_date: date,
+    end_date: date,
+) -> Iterator[dict[str, Any]]:
+    """Yield each page of the cost report for a date range.
+
+    The report is cursor-paginated: each page says whether more follow
+    (has_more) and the cursor to pass as the next request's page param.
+
+    Args:
+        client: HTTP client to issue requests with
+        admin_api_key: Anthropic Admin API key (sk-ant-admin-...)
+        start_date: Start of the period
+        end_date: End of the period (exclusive)
+
+    Yields:
+        Parsed JSON body of each page
+    """
+    params = {
+        "starting_at": f"{start_date.isoformat()}T00:00:00Z",
+        "ending_at": f"{end_date.isoformat()}T00:00:00Z",
+    }
+
+    headers = {
+        "anthropic-version": ANTHROPIC_API_VERSION,
+        "x-api-key": admin_api_key,
+    }
+
+    while True:
+        response = client.get(
+            ANTHROPIC_COST_API_URL,
+            params=params,
+            headers=headers,
+        )
+        response.raise_for_status()
+        data = response.json()
+        yield data
+
+        # Check for more pages; httpx encodes params per request, so the
+        # cursor is simply updated in place
+        if data.get("has_more") and data.get("next_page"):
+            params["page"] = data["next_page"]
+        else:
+            break
+
+
 class AnthropicCostCollector(CostCollector):
     """Collector for Anthropic Claude API costs.
 
@@ -190,33 +240,12 @@ class AnthropicCostCollector(CostCollector):
         Returns:
             List of DailyCost objects
         """
-        base_params = {
-            "starting_at": f"{start_date.isoformat()}T00:00:00Z",
-            "ending_at": f"{end_date.isoformat()}T00:00:00Z",
-        }
-
-        headers = {
-            "anthropic-version": ANTHROPIC_API_VERSION,
-            "x-api-key": self._admin_api_key,
-        }
-
         # Aggregate daily costs across all pages
         daily_totals: dict[str, Decimal] = {}
-        next_page = None
-
-        while True:
-            params = dict(base_params)
-            if next_page:
-                params["page"] = next_page
-
-            response = self._client.get(
-                ANTHROPIC_COST_API_URL,
-                params=params,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
 
+        for data in iter_cost_report_pages(
+            self._client, self._admin_api_key, start_date, end_date
+        ):
             for bucket in data.get("data", []):
                 # Field is "starting_at" not "bucket_start_time"
                 bucket_date = bucket.get("starting_at", "")[:10]  # YYYY-MM-DD
@@ -235,12 +264,6 @@ class AnthropicCostCollector(CostCollector):
                 else:
                     daily_totals[bucket_date] = total_dollars
 
-            # Check for more pages
-            if data.get("has_more") and data.get("next_page"):
-                next_page = data["next_page"]
-            else:
-                break
-
         daily_costs = [
             DailyCost(date=d, cost=round(float(c), 4))
             for d, c in daily_totals.items()
@@ -252,16 +275,24 @@ class AnthropicCostCollector(CostCollector):
 
         Compares first half to second half of the period.
         """
-        if len(daily_costs) < 2:
+        count = len(daily_costs)
+        if count < 2:
             return "unknown"
 
-        mid = len(daily_costs) // 2
-        first_half = sum(dc.cost for dc in daily_costs[:mid])
-        second_half = sum(dc.cost for dc in daily_costs[mid:])
-
-        # Normalize for different period lengths
-        first_avg = first_half / mid if mid > 0 else 0
-        second_avg = second_half / (len(daily_costs) - mid) if (len(daily_costs) - mid) > 0 else 0
+        # Single running sum; the first half is captured at the midpoint and
+        # the second half is derived from the total
+        mid = count // 2
+        total = 0.0
+        first_half = 0.0
+        for i, dc in enumerate(daily_costs, 1):
+            total += dc.cost
+            if i == mid:
+                first_half = total
+        second_half = total - first_half
+
+        # Normalize for different period lengths (mid >= 1 since count >= 2)
+        first_avg = first_half / mid
+        second_avg = second_half / (count - mid)
 
         if first_avg == 0:
             return "unknown"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import date, datetime
 
 import boto3
@@ -9,6 +10,8 @@ from botocore.exceptions import ClientError
 
 from slack_aws_cost_guardian.collectors.base import BudgetInfo
 
+logger = logging.getLogger(__name__)
+
 
 class BudgetsCollector:
     """
@@ -70,24 +73,31 @@ class BudgetsCollector:
             List of BudgetInfo objects for each configured budget.
         """
         try:
-            response = self.budgets_client.describe_budgets(AccountId=self.account_id)
+            # describe_budgets returns at most one page per call; paginate so
+            # accounts with many budgets aren't silently truncated
+            paginator = self.budgets_client.get_paginator("describe_budgets")
+            pages = paginator.paginate(
+                AccountId=self.account_id,
+                PaginationConfig={"PageSize": 100},  # API maximum
+            )
 
             budgets = []
-            for budget in response.get("Budgets", []):
-                budget_info = self._parse_budget(budget)
-                if budget_info:
-                    budgets.append(budget_info)
+            for page in pages:
+                for budget in page.get("Budgets", []):
+                    budget_info = self._parse_budget(budget)
+                    if budget_info:
+                        budgets.append(budget_info)
 
             return budgets
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
             if error_code == "AccessDeniedException":
-                print("No permission to access Budgets API")
+                logger.warning("No permission to access Budgets API")
             elif error_code == "NotFoundException":
-                print("No budgets configured")
+                logger.info("No budgets configured")
             else:
-                print(f"Error getting budgets: {e}")
+                logger.warning("Error getting budgets: %s", e)
             return []
 
     def _parse_budget(self, budget: dict) -> BudgetInfo | None:
@@ -100,15 +110,15 @@ class BudgetsCollector:
             if budget_type != "COST":
                 return None
 
-            limit = float(budget.get("BudgetLimit", {}).get("Amount", 0))
-            calculated_spend = budget.get("CalculatedSpend", {})
+            # Resolve each nested section once
+            budget_limit = budget.get("BudgetLimit") or {}
+            calculated_spend = budget.get("CalculatedSpend") or {}
+            actual = calculated_spend.get("ActualSpend") or {}
+            forecasted = calculated_spend.get("ForecastedSpend") or {}
 
-            actual_spend = float(
-                calculated_spend.get("ActualSpend", {}).get("Amount", 0)
-            )
-            forecasted_spend = float(
-                calculated_spend.get("ForecastedSpend", {}).get("Amount", 0)
-            )
+            limit = float(budget_limit.get("Amount", 0))
+            actual_spend = float(actual.get("Amount", 0))
+            forecasted_spend = float(forecasted.get("Amount", 0))
 
             percentage_used = (actual_spend / limit * 100) if limit > 0 else 0
 
@@ -118,11 +128,11 @@ class BudgetsCollector:
                 actual_spend=round(actual_spend, 2),
                 forecasted_spend=round(forecasted_spend, 2),
                 percentage_used=round(percentage_used, 1),
-                currency=budget.get("BudgetLimit", {}).get("Unit", "USD"),
+                currency=budget_limit.get("Unit", "USD"),
             )
 
         except (KeyError, ValueError) as e:
-            print(f"Error parsing budget: {e}")
+            logger.warning("Error parsing budget: %s", e)
             return None
 
     def get_budget_status(self, budget_name: str) -> BudgetInfo | None:
@@ -147,5 +157,5 @@ class BudgetsCollector:
             error_code = e.response.get("Error", {}).get("Code", "")
             if error_code == "NotFoundException":
                 return None
-            print(f"Error getting budget {budget_name}: {e}")
+            logger.warning("Error getting budget %s: %s", budget_name, e)
             return None
\ No newline at end of file
@@ -5,10 +5,13 @@ Cost Explorer API charges $0.01 per request.
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
 from typing import Literal
 
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from slack_aws_cost_guardian.collectors.base import (
@@ -19,6 +22,13 @@ from slack_aws_cost_guardian.collectors.base import (
     ForecastInfo,
 )
 
+logger = logging.getLogger(__name__)
+
+# Cost Explorer's request rate limit is shared across the account, so runs
+# that overlap can be throttled (LimitExceededException). Retry with
+# exponential backoff and jitter, for more attempts than the default allows.
+CE_CLIENT_CONFIG = BotoConfig(retries={"mode": "standard", "total_max_attempts": 8})
+
 
 class CostExplorerCollector(CostCollector):
     """
@@ -64,7 +74,9 @@ class CostExplorerCollector(CostCollector):
     def ce_client(self) -> boto3.client:
         """Get or create Cost Explorer client."""
         if self._ce_client is None:
-            self._ce_client = boto3.client("ce", region_name=self.region)
+            self._ce_client = boto3.client(
+                "ce", region_name=self.region, config=CE_CLIENT_CONFIG
+            )
         return self._ce_client
 
     @property
@@ -98,23 +110,59 @@ class CostExplorerCollector(CostCollector):
         Returns:
             CostData with cost breakdown and trends.
         """
+        # Sample the clock once so every query in this collection agrees on
+        # "today" (avoids inconsistent ranges if a run straddles midnight)
+        now = datetime.now(UTC)
+        today = now.date()
+
         # Default date range
         if end_date is None:
-            end_date = date.today()
+            end_date = today
         if start_date is None:
             start_date = end_date - timedelta(days=lookback_days)
 
-        collection_timestamp = datetime.now(UTC).isoformat() + "Z"
+        collection_timestamp = now.isoformat() + "Z"
+
+        # Widen the daily query back to the start of the month so the same
+        # response also yields month-to-date spend for the forecast, saving a
+        # separate Cost Explorer request
+        month_start = today.replace(day=1)
 
-        # Collect all cost data
-        daily_costs = self._get_daily_costs(start_date, end_date)
-        cost_by_service = self._get_cost_by_service(start_date, end_date)
-        cost_by_account = self._get_cost_by_account(start_date, end_date)
-        forecast = self._get_forecast()
+        # The queries are independent round trips, so issue them concurrently.
+        # boto3 clients are thread-safe; resolve the lazy client first so the
+        # workers share one instance.
+        _ = self.ce_client
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            daily_future = executor.submit(
+                self._get_daily_totals, min(start_date, month_start), end_date
+            )
+            service_future = executor.submit(self._get_cost_by_service, today)
+            account_future = executor.submit(self._get_cost_by_account, start_date, end_date)
+            daily_totals = daily_future.result()
+
+            start_iso = start_date.isoformat()
+            daily_costs = [
+                DailyCost(date=cost_date, cost=round(cost, 2))
+                for cost_date, cost in daily_totals or []
+                if cost_date >= start_iso
+            ]
+
+            # Month-to-date is only derivable when the query ran through today
+            month_to_date: float | None = None
+            if daily_totals is not None and end_date == today:
+                month_start_iso = month_start.isoformat()
+                month_to_date = sum(
+                    cost for cost_date, cost in daily_totals if cost_date >= month_start_iso
+                )
+
+            # Forecast runs on this thread while the remaining queries finish
+            forecast = self._get_forecast(today, current_spend=month_to_date)
+            cost_by_service = service_future.result()
+            cost_by_account = account_future.result()
 
         # Calculate the actual date the cost_by_service data represents
         # (cost_data_lag_days ago, for accuracy)
-        cost_data_date = (date.today() - timedelta(days=self.cost_data_lag_days)).isoformat()
+        cost_data_date = (today - timedelta(days=self.cost_data_lag_days)).isoformat()
 
         # Calculate totals and trends
         # total_cost should be yesterday's cost (matching cost_by_service)
@@ -142,8 +190,15 @@ class CostExplorerCollector(CostCollector):
             average_daily_cost=round(average_daily, 2),
         )
 
-    def _get_daily_costs(self, start_date: date, end_date: date) -> list[DailyCost]:
-        """Get daily cost breakdown."""
+    def _get_daily_totals(
+        self, start_date: date, end_date: date
+    ) -> list[tuple[str, float]] | None:
+        """
+        Get unrounded daily cost totals as (date, cost) pairs.
+
+        Returns None if the query fails, so callers can tell "no data" apart
+        from "no spend".
+        """
         try:
             response = self.ce_client.get_cost_and_usage(
                 TimePeriod={
@@ -154,27 +209,27 @@ class CostExplorerCollector(CostCollector):
                 Metrics=["UnblendedCost"],
             )
 
-            daily_costs = []
-            for result in response.get("ResultsByTime", []):
-                cost_date = result["TimePeriod"]["Start"]
-                cost = float(result["Total"]["UnblendedCost"]["Amount"])
-                daily_costs.append(DailyCost(date=cost_date, cost=round(cost, 2)))
-
-            return daily_costs
+            return [
+                (
+                    result["TimePeriod"]["Start"],
+                    float(result["Total"]["UnblendedCost"]["Amount"]),
+                )
+                for result in response.get("ResultsByTime", [])
+            ]
 
         except ClientError as e:
-            # Log error but don't fail - return empty list
-            print(f"Error getting daily costs: {e}")
-            return []
+            # Log error but don't fail
+            logger.warning("Error getting daily costs: %s", e)
+            return None
 
-    def _get_cost_by_service(self, start_date: date, end_date: date) -> dict[str, float]:
+    def _get_cost_by_service(self, today: date) -> dict[str, float]:
         """
         Get cost breakdown by AWS service for a single day.
 
         For anomaly detection and daily snapshots, we need consistent single-day
-        costs per service. The start_date/end_date params are ignored here;
-        we query costs from `cost_data_lag_days` ago to ensure data has fully
-        populated (AWS Cost Explorer takes 24-48 hours for accurate data).
+        costs per service. We query costs from `cost_data_lag_days` before
+        `today` to ensure data has fully populated (AWS Cost Explorer takes
+        24-48 hours for accurate data).
 
         The lookback period (start_date to end_date) is still used for:
         - daily_costs: Historical trend data
@@ -182,7 +237,7 @@ class CostExplorerCollector(CostCollector):
         - forecast: End-of-month projections
         """
         # Query costs from N days ago to allow data to fully populate
-        target_date = date.today() - timedelta(days=self.cost_data_lag_days)
+        target_date = today - timedelta(days=self.cost_data_lag_days)
         query_start = target_date
         query_end = target_date + timedelta(days=1)
 
@@ -197,20 +252,23 @@ class CostExplorerCollector(CostCollector):
                 GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
             )
 
-            cost_by_service: dict[str, float] = {}
-            for result in response.get("ResultsByTime", []):
-                for group in result.get("Groups", []):
-                    service_name = group["Keys"][0]
-                    cost = float(group["Metrics"]["UnblendedCost"]["Amount"])
-                    if cost > 0.001:  # Filter out negligible costs (< $0.001)
-                        cost_by_service[service_name] = round(cost, 4)
-
-            return cost_by_service
+            return self._parse_cost_by_service(response)
 
         except ClientError as e:
-            print(f"Error getting cost by service: {e}")
+            logger.warning("Error getting cost by service: %s", e)
             return {}
 
+    @staticmethod
+    def _parse_cost_by_service(response: dict) -> dict[str, float]:
+        """Parse a SERVICE-grouped get_cost_and_usage response."""
+        return {
+            group["Keys"][0]: round(cost, 4)
+            for result in response.get("ResultsByTime", [])
+            for group in result.get("Groups", [])
+            # Filter out negligible costs (< $0.001)
+            if (cost := float(group["Metrics"]["UnblendedCost"]["Amount"])) > 0.001
+        }
+
     def _get_cost_by_account(
         self, start_date: date, end_date: date
     ) -> dict[str, AccountCostData]:
@@ -232,13 +290,14 @@ class CostExplorerCollector(CostCollector):
                     account_id = group["Keys"][0]
                     cost = float(group["Metrics"]["UnblendedCost"]["Amount"])
                     if cost > 0.001:  # Filter out negligible costs (< $0.001)
-                        if account_id not in cost_by_account:
-                            cost_by_account[account_id] = AccountCostData(
+                        entry = cost_by_account.get(account_id)
+                        if entry is None:
+                            entry = cost_by_account[account_id] = AccountCostData(
                                 account_id=account_id,
                                 account_name=account_id,  # Name requires Organizations API
-                                total_cost=0,
+                                total_cost=0.0,
                             )
-                        cost_by_account[account_id].total_cost += round(cost, 2)
+                        entry.total_cost += round(cost, 2)
 
             return cost_by_account
 
@@ -246,28 +305,36 @@ class CostExplorerCollector(CostCollector):
             # This might fail if not using Organizations - that's OK
             if "LINKED_ACCOUNT" in str(e):
                 return {}
-            print(f"Error getting cost by account: {e}")
+            logger.warning("Error getting cost by account: %s", e)
             return {}
 
-    def _get_forecast(self) -> ForecastInfo | None:
-        """Get end-of-month cost forecast."""
+    def _get_forecast(
+        self, today: date, current_spend: float | None = None
+    ) -> ForecastInfo | None:
+        """
+        Get end-of-month cost forecast.
+
+        Args:
+            today: Reference date for the current month.
+            current_spend: Month-to-date spend if already known. When None,
+                it is queried from Cost Explorer separately.
+        """
         try:
-            now = date.today()
-            month_start = now.replace(day=1)
+            month_start = today.replace(day=1)
             # Calculate the first day of next month
-            if now.month == 12:
-                month_end = now.replace(year=now.year + 1, month=1, day=1)
+            if today.month == 12:
+                month_end = today.replace(year=today.year + 1, month=1, day=1)
             else:
-                month_end = now.replace(month=now.month + 1, day=1)
+                month_end = today.replace(month=today.month + 1, day=1)
 
             # Can't forecast if we're at the end of month
-            if now >= month_end - timedelta(days=1):
+            if today >= month_end - timedelta(days=1):
                 return None
 
             # Get forecast
             forecast_response = self.ce_client.get_cost_forecast(
                 TimePeriod={
-                    "Start": now.isoformat(),
+                    "Start": today.isoformat(),
                     "End": month_end.isoformat(),
                 },
                 Metric="UNBLENDED_COST",
@@ -276,24 +343,25 @@ class CostExplorerCollector(CostCollector):
 
             forecasted_total = float(forecast_response["Total"]["Amount"])
 
-            # Get current month spend
-            current_response = self.ce_client.get_cost_and_usage(
-                TimePeriod={
-                    "Start": month_start.isoformat(),
-                    "End": now.isoformat(),
-                },
-                Granularity="MONTHLY",
-                Metrics=["UnblendedCost"],
-            )
-
-            current_spend = 0.0
-            if current_response.get("ResultsByTime"):
-                current_spend = float(
-                    current_response["ResultsByTime"][0]["Total"]["UnblendedCost"]["Amount"]
+            # Get current month spend (unless the caller already has it)
+            if current_spend is None:
+                current_response = self.ce_client.get_cost_and_usage(
+                    TimePeriod={
+                        "Start": month_start.isoformat(),
+                        "End": today.isoformat(),
+                    },
+                    Granularity="MONTHLY",
+                    Metrics=["UnblendedCost"],
                 )
 
-            days_elapsed = (now - month_start).days
-            days_remaining = (month_end - now).days
+                current_spend = 0.0
+                if current_response.get("ResultsByTime"):
+                    current_spend = float(
+                        current_response["ResultsByTime"][0]["Total"]["UnblendedCost"]["Amount"]
+                    )
+
+            days_elapsed = (today - month_start).days
+            days_remaining = (month_end - today).days
             daily_average = current_spend / days_elapsed if days_elapsed > 0 else 0
 
             return ForecastInfo(
@@ -306,7 +374,7 @@ class CostExplorerCollector(CostCollector):
 
         except ClientError as e:
             # Forecast might fail with insufficient data
-            print(f"Error getting forecast: {e}")
+            logger.warning("Error getting forecast: %s", e)
             return None
 
     def _calculate_trend(self, daily_costs: list[DailyCost]) -> str:
@@ -315,16 +383,24 @@ class CostExplorerCollector(CostCollector):
 
         Compares first half to second half of the period.
         """
-        if len(daily_costs) < 2:
+        count = len(daily_costs)
+        if count < 2:
             return "unknown"
 
-        mid = len(daily_costs) // 2
-        first_half = sum(dc.cost for dc in daily_costs[:mid])
-        second_half = sum(dc.cost for dc in daily_costs[mid:])
-
-        # Normalize for different period lengths
-        first_avg = first_half / mid if mid > 0 else 0
-        second_avg = second_half / (len(daily_costs) - mid) if (len(daily_costs) - mid) > 0 else 0
+        # Single running sum; the first half is captured at the midpoint and
+        # the second half is derived from the total
+        mid = count // 2
+        total = 0.0
+        first_half = 0.0
+        for i, dc in enumerate(daily_costs, 1):
+            total += dc.cost
+            if i == mid:
+                first_half = total
+        second_half = total - first_half
+
+        # Normalize for different period lengths (mid >= 1 since count >= 2)
+        first_avg = first_half / mid
+        second_avg = second_half / (count - mid)
 
         if first_avg == 0:
             return "unknown"
@@ -357,16 +433,8 @@ class CostExplorerCollector(CostCollector):
                 GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
             )
 
-            cost_by_service: dict[str, float] = {}
-            for result in response.get("ResultsByTime", []):
-                for group in result.get("Groups", []):
-                    service_name = group["Keys"][0]
-                    cost = float(group["Metrics"]["UnblendedCost"]["Amount"])
-                    if cost > 0.001:  # Filter out negligible costs (< $0.001)
-                        cost_by_service[service_name] = round(cost, 4)
-
-            return cost_by_service
+            return self._parse_cost_by_service(response)
 
         except ClientError as e:
-            print(f"Error getting cost for date: {e}")
+            logger.warning("Error getting cost for date: %s", e)
             return {}
\ No newline at end of file
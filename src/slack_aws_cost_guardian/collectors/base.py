@@ -14,14 +14,16 @@ class ServiceCost:
     currency: str = "USD"
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountCostData:
     """Cost data for a linked account."""
 
     account_id: str
     account_name: str
     total_cost: float
-    cost_by_service: dict[str, float] = field(default_factory=dict)
+    # Not populated by the collectors today; left as None rather than
+    # allocating an empty dict for every linked account
+    cost_by_service: dict[str, float] | None = None
 
 
 @dataclass
@@ -10,7 +10,12 @@ from slack_aws_cost_guardian.config.schema import (
     ReportConfig,
     SlackConfig,
 )
-from slack_aws_cost_guardian.config.loader import load_config, load_guardian_context
+from slack_aws_cost_guardian.config.loader import (
+    get_cached_config,
+    get_cached_guardian_context,
+    load_config,
+    load_guardian_context,
+)
 
 __all__ = [
     "Config",
@@ -23,4 +28,6 @@ __all__ = [
     "ReportConfig",
     "load_config",
     "load_guardian_context",
+    "get_cached_config",
+    "get_cached_guardian_context",
 ]
\ No newline at end of file
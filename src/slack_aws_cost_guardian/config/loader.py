@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import codecs
 import os
+import time
 from functools import lru_cache
 from pathlib import Path
 
@@ -12,6 +14,22 @@ from botocore.exceptions import ClientError
 
 from slack_aws_cost_guardian.config.schema import Config
 
+_S3_CHUNK_SIZE = 64 * 1024
+
+# How long a warm Lambda container reuses a fetched guardian context
+_GUARDIAN_CONTEXT_TTL_SECONDS = 300.0
+_guardian_context_cache: dict[tuple[str, str], tuple[float, str]] = {}
+
+# Common overrides via environment variables: (env var, config path)
+_ENV_MAPPINGS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("AWS_REGION", ("aws", "region")),
+    ("AWS_ACCOUNT_ID", ("aws", "account_id")),
+    ("LLM_PROVIDER", ("llm", "provider")),
+    ("MONTHLY_BUDGET", ("budgets", "monthly", "amount")),
+    ("SLACK_ENABLED", ("slack", "enabled")),
+    ("ANTHROPIC_COSTS_ENABLED", ("collection", "sources", "anthropic", "enabled")),
+)
+
 
 def _deep_merge(base: dict, override: dict) -> dict:
     """Deep merge two dictionaries, with override taking precedence."""
@@ -84,36 +102,31 @@ def load_config(
     # Set environment in config
     config_data["environment"] = environment
 
-    return Config(**config_data)
+    return Config.model_validate(config_data)
 
 
 def _apply_env_overrides(config_data: dict) -> dict:
     """Apply environment variable overrides to configuration."""
-    # Common overrides via environment variables
-    env_mappings = {
-        "AWS_REGION": ("aws", "region"),
-        "AWS_ACCOUNT_ID": ("aws", "account_id"),
-        "LLM_PROVIDER": ("llm", "provider"),
-        "MONTHLY_BUDGET": ("budgets", "monthly", "amount"),
-        "SLACK_ENABLED": ("slack", "enabled"),
-        "ANTHROPIC_COSTS_ENABLED": ("collection", "sources", "anthropic", "enabled"),
-    }
-
-    for env_var, path in env_mappings.items():
-        if value := os.environ.get(env_var):
-            # Navigate to the nested key and set the value
-            current = config_data
-            for key in path[:-1]:
-                current = current.setdefault(key, {})
-
-            # Convert types as needed
-            final_key = path[-1]
-            if final_key in ("amount",):
-                current[final_key] = float(value)
-            elif final_key in ("enabled",):
-                current[final_key] = value.lower() in ("true", "1", "yes")
-            else:
-                current[final_key] = value
+    env = os.environ
+
+    for env_var, path in _ENV_MAPPINGS:
+        value = env.get(env_var)
+        if not value:
+            continue
+
+        # Navigate to the nested key and set the value
+        current = config_data
+        for key in path[:-1]:
+            current = current.setdefault(key, {})
+
+        # Convert types as needed
+        final_key = path[-1]
+        if final_key == "amount":
+            current[final_key] = float(value)
+        elif final_key == "enabled":
+            current[final_key] = value.lower() in ("true", "1", "yes")
+        else:
+            current[final_key] = value
 
     return config_data
 
@@ -139,7 +152,12 @@ def load_guardian_context(
 
     try:
         response = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-        return response["Body"].read().decode("utf-8")
+        # Decode incrementally from the stream rather than buffering the
+        # whole object as bytes before decoding
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        parts = [decoder.decode(chunk) for chunk in response["Body"].iter_chunks(_S3_CHUNK_SIZE)]
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "")
         if error_code == "NoSuchKey":
@@ -155,4 +173,38 @@ def get_cached_config() -> Config:
 
     Useful for Lambda handlers to avoid re-loading config on warm starts.
     """
-    return load_config()
\ No newline at end of file
+    return load_config()
+
+
+def get_cached_guardian_context(
+    bucket_name: str,
+    s3_key: str = "config/guardian-context.md",
+    s3_client: boto3.client | None = None,
+    ttl_seconds: float = _GUARDIAN_CONTEXT_TTL_SECONDS,
+) -> str:
+    """
+    Get guardian context, reusing a recent fetch from S3.
+
+    Lambda containers persist between invocations, so the context is only
+    re-read once it is older than ttl_seconds. Edits to the file in S3 are
+    picked up after at most that long.
+
+    Args:
+        bucket_name: S3 bucket name.
+        s3_key: S3 object key for the context file.
+        s3_client: Optional boto3 S3 client. If None, creates a new one.
+        ttl_seconds: Maximum age of a cached context in seconds.
+
+    Returns:
+        str: Guardian context content, or empty string if not found.
+    """
+    cache_key = (bucket_name, s3_key)
+    now = time.monotonic()
+
+    cached = _guardian_context_cache.get(cache_key)
+    if cached is not None and now - cached[0] < ttl_seconds:
+        return cached[1]
+
+    context = load_guardian_context(bucket_name, s3_key=s3_key, s3_client=s3_client)
+    _guardian_context_cache[cache_key] = (now, context)
+    return context
@@ -2,17 +2,29 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat
 
 
-class AWSConfig(BaseModel):
+class _Base(BaseModel):
+    """Base for config sub-models.
+
+    Validators are built lazily (or as part of the root Config schema)
+    instead of eagerly for every class at import time. Config is read-only
+    once loaded, and unknown keys are rejected so typos in YAML surface at
+    load time instead of being silently ignored.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
+
+
+class AWSConfig(_Base):
     """AWS account configuration."""
 
     region: str = "us-east-1"
     account_id: str | None = None  # Auto-detected if not provided
 
 
-class CostExplorerSourceConfig(BaseModel):
+class CostExplorerSourceConfig(_Base):
     """Cost Explorer data source configuration."""
 
     enabled: bool = True
@@ -23,13 +35,13 @@ class CostExplorerSourceConfig(BaseModel):
     cost_data_lag_days: int = Field(default=2, ge=1, le=7)
 
 
-class BudgetsSourceConfig(BaseModel):
+class BudgetsSourceConfig(_Base):
     """AWS Budgets data source configuration."""
 
     enabled: bool = True
 
 
-class AnthropicCostSourceConfig(BaseModel):
+class AnthropicCostSourceConfig(_Base):
     """Anthropic API cost collection configuration.
 
     Requires an Anthropic Organization account and Admin API key.
@@ -38,9 +50,12 @@ class AnthropicCostSourceConfig(BaseModel):
 
     enabled: bool = False  # Disabled by default, requires org account
     admin_api_key_secret_key: str = "anthropic_admin_api_key"  # Key within LLM secrets
+    # Cost data is daily-granular, so warm invocations on sub-daily schedules
+    # reuse the last collection for this long instead of calling the API again
+    cache_ttl_seconds: int = Field(default=3600, ge=0)
 
 
-class CollectionSourcesConfig(BaseModel):
+class CollectionSourcesConfig(_Base):
     """Cost collection data sources."""
 
     cost_explorer: CostExplorerSourceConfig = Field(default_factory=CostExplorerSourceConfig)
@@ -48,7 +63,7 @@ class CollectionSourcesConfig(BaseModel):
     anthropic: AnthropicCostSourceConfig = Field(default_factory=AnthropicCostSourceConfig)
 
 
-class RetentionConfig(BaseModel):
+class RetentionConfig(_Base):
     """Data retention configuration (in days)."""
 
     hourly_days: int = Field(default=7, ge=1)
@@ -56,15 +71,15 @@ class RetentionConfig(BaseModel):
     monthly_days: int = Field(default=730, ge=1)  # 2 years
 
 
-class ScheduleConfig(BaseModel):
+class ScheduleConfig(_Base):
     """Collection schedule configuration."""
 
     frequency: Literal["hourly", "4x_daily", "2x_daily", "daily"] = "4x_daily"
-    hours: list[int] = Field(default=[6, 12, 18, 0])  # UTC hours for 4x_daily
+    hours: tuple[int, ...] = (6, 12, 18, 0)  # UTC hours for 4x_daily
     timezone: str = "UTC"
 
 
-class CollectionConfig(BaseModel):
+class CollectionConfig(_Base):
     """Cost collection configuration."""
 
     schedule: ScheduleConfig = Field(default_factory=ScheduleConfig)
@@ -72,45 +87,45 @@ class CollectionConfig(BaseModel):
     retention: RetentionConfig = Field(default_factory=RetentionConfig)
 
 
-class MonthlyBudgetConfig(BaseModel):
+class MonthlyBudgetConfig(_Base):
     """Monthly budget configuration."""
 
-    amount: float = Field(default=900.0, ge=0)
+    amount: StrictFloat = Field(default=900.0, ge=0)
     currency: str = "USD"
     warning_threshold: int = Field(default=80, ge=0, le=100)  # Percentage
     critical_threshold: int = Field(default=100, ge=0, le=200)  # Percentage
 
 
-class DailyBudgetConfig(BaseModel):
+class DailyBudgetConfig(_Base):
     """Daily budget configuration."""
 
-    amount: float = Field(default=30.0, ge=0)
+    amount: StrictFloat = Field(default=30.0, ge=0)
     warning_threshold: int = Field(default=100, ge=0, le=200)  # Percentage
 
 
-class BudgetConfig(BaseModel):
+class BudgetConfig(_Base):
     """Budget configuration."""
 
     monthly: MonthlyBudgetConfig = Field(default_factory=MonthlyBudgetConfig)
     daily: DailyBudgetConfig = Field(default_factory=DailyBudgetConfig)
 
 
-class AnomalyThresholdsConfig(BaseModel):
+class AnomalyThresholdsConfig(_Base):
     """Anomaly detection thresholds."""
 
-    absolute: float = Field(default=100.0, ge=0)  # Dollar amount
-    percent_change: float = Field(default=50.0, ge=0)  # Percentage
-    std_deviations: float = Field(default=2.5, ge=0)  # Standard deviations
+    absolute: StrictFloat = Field(default=100.0, ge=0)  # Dollar amount
+    percent_change: StrictFloat = Field(default=50.0, ge=0)  # Percentage
+    std_deviations: StrictFloat = Field(default=2.5, ge=0)  # Standard deviations
 
 
-class AnomalyFiltersConfig(BaseModel):
+class AnomalyFiltersConfig(_Base):
     """Anomaly detection filters."""
 
-    minimum_cost: float = Field(default=5.0, ge=0)  # Ignore anomalies under this
-    new_service_minimum: float = Field(default=1.0, ge=0)  # New service threshold
+    minimum_cost: StrictFloat = Field(default=5.0, ge=0)  # Ignore anomalies under this
+    new_service_minimum: StrictFloat = Field(default=1.0, ge=0)  # New service threshold
 
 
-class AnomalyDetectionConfig(BaseModel):
+class AnomalyDetectionConfig(_Base):
     """Anomaly detection configuration."""
 
     enabled: bool = True
@@ -120,64 +135,92 @@ class AnomalyDetectionConfig(BaseModel):
     alert_on_new_services: bool = True
 
 
-class AnthropicConfig(BaseModel):
+class ProviderConfig(_Base):
+    """Per-provider LLM configuration (shared by all providers)."""
+
+    model_id: str
+    # api_key loaded from Secrets Manager
+
+
+class AnthropicConfig(ProviderConfig):
     """Anthropic API configuration."""
 
     model_id: str = "claude-sonnet-4-20250514"
-    # api_key loaded from Secrets Manager
 
 
-class OpenAIConfig(BaseModel):
+class OpenAIConfig(ProviderConfig):
     """OpenAI API configuration."""
 
     model_id: str = "gpt-4o"
-    # api_key loaded from Secrets Manager
 
 
-class LLMConfig(BaseModel):
+class LLMConfig(_Base):
     """LLM provider configuration."""
 
     provider: Literal["anthropic", "openai"] = "anthropic"
     anthropic: AnthropicConfig = Field(default_factory=AnthropicConfig)
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
-    temperature: float = Field(default=0.3, ge=0, le=1)
+    temperature: StrictFloat = Field(default=0.3, ge=0, le=1)
     max_tokens: int = Field(default=2000, ge=100, le=8000)
+    # Anomalies below this severity are alerted without AI analysis
+    min_severity: Literal["info", "warning", "critical"] = "warning"
 
 
-class SlackChannelConfig(BaseModel):
+class SlackChannelConfig(_Base):
     """Slack channel configuration."""
 
     name: str
     webhook_secret_key: str  # Key name in Secrets Manager
 
 
-class SlackFeaturesConfig(BaseModel):
+class SlackFeaturesConfig(_Base):
     """Slack features configuration."""
 
     interactive_buttons: bool = True
     thread_replies: bool = False  # Phase 2
 
 
-class SlackConfig(BaseModel):
+ChannelName = Literal["critical", "heartbeat"]
+RouteEvent = Literal[
+    "budget_warning",
+    "budget_critical",
+    "anomaly_warning",
+    "anomaly_critical",
+    "daily_report",
+    "weekly_report",
+]
+
+
+class SlackChannels(_Base):
+    """The fixed set of Slack channels alerts are routed to."""
+
+    critical: SlackChannelConfig = Field(
+        default_factory=lambda: SlackChannelConfig(
+            name="#aws-alerts-critical",
+            webhook_secret_key="webhook_url_critical",
+        )
+    )
+    heartbeat: SlackChannelConfig = Field(
+        default_factory=lambda: SlackChannelConfig(
+            name="#aws-alerts-general",
+            webhook_secret_key="webhook_url_heartbeat",
+        )
+    )
+
+    def webhook_secret_key_for_channel(self, channel: ChannelName) -> str:
+        """Return the webhook secret key for a channel named by RoutingConfig."""
+        return getattr(self, channel).webhook_secret_key
+
+
+class SlackConfig(_Base):
     """Slack integration configuration."""
 
     enabled: bool = True
-    channels: dict[str, SlackChannelConfig] = Field(
-        default_factory=lambda: {
-            "critical": SlackChannelConfig(
-                name="#aws-alerts-critical",
-                webhook_secret_key="webhook_url_critical",
-            ),
-            "heartbeat": SlackChannelConfig(
-                name="#aws-alerts-general",
-                webhook_secret_key="webhook_url_heartbeat",
-            ),
-        }
-    )
+    channels: SlackChannels = Field(default_factory=SlackChannels)
     features: SlackFeaturesConfig = Field(default_factory=SlackFeaturesConfig)
 
 
-class DailyReportConfig(BaseModel):
+class DailyReportConfig(_Base):
     """Daily report configuration."""
 
     enabled: bool = True
@@ -186,7 +229,7 @@ class DailyReportConfig(BaseModel):
     include_ai_insights: bool = True
 
 
-class WeeklyReportConfig(BaseModel):
+class WeeklyReportConfig(_Base):
     """Weekly report configuration."""
 
     enabled: bool = True
@@ -198,34 +241,47 @@ class WeeklyReportConfig(BaseModel):
     include_ai_insights: bool = True
 
 
-class ReportConfig(BaseModel):
+class ReportConfig(_Base):
     """Reporting configuration."""
 
     daily: DailyReportConfig = Field(default_factory=DailyReportConfig)
     weekly: WeeklyReportConfig = Field(default_factory=WeeklyReportConfig)
 
 
-class RoutingConfig(BaseModel):
-    """Notification routing configuration."""
+class RoutingConfig(_Base):
+    """Notification routing configuration (values name a SlackChannels field)."""
+
+    budget_warning: ChannelName = "heartbeat"
+    budget_critical: ChannelName = "critical"
+    anomaly_warning: ChannelName = "heartbeat"
+    anomaly_critical: ChannelName = "critical"
+    daily_report: ChannelName = "heartbeat"
+    weekly_report: ChannelName = "heartbeat"
 
-    budget_warning: str = "heartbeat"
-    budget_critical: str = "critical"
-    anomaly_warning: str = "heartbeat"
-    anomaly_critical: str = "critical"
-    daily_report: str = "heartbeat"
-    weekly_report: str = "heartbeat"
+    def route(self, event: RouteEvent) -> ChannelName:
+        """Return the channel an event type is routed to."""
+        return getattr(self, event)
 
 
-class GuardianContextConfig(BaseModel):
+class GuardianContextConfig(_Base):
     """Guardian context file configuration."""
 
     s3_key: str = "config/guardian-context.md"
     local_path: str = "config/guardian-context.md"
 
 
+# Copied per instance by dict.copy (pydantic would deep-copy a plain default)
+_DEFAULT_TAGS: dict[str, str] = {
+    "Project": "slack-aws-cost-guardian",
+    "ManagedBy": "CDK",
+}
+
+
 class Config(BaseModel):
     """Root configuration for Slack AWS Cost Guardian."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     project_name: str = "slack-aws-cost-guardian"
     environment: Literal["dev", "staging", "prod"] = "dev"
 
@@ -240,9 +296,4 @@ class Config(BaseModel):
     guardian_context: GuardianContextConfig = Field(default_factory=GuardianContextConfig)
 
     # Resource tags
-    tags: dict[str, str] = Field(
-        default_factory=lambda: {
-            "Project": "slack-aws-cost-guardian",
-            "ManagedBy": "CDK",
-        }
-    )
\ No newline at end of file
+    tags: dict[str, str] = Field(default_factory=_DEFAULT_TAGS.copy)
\ No newline at end of file
@@ -8,21 +8,41 @@ This Lambda is triggered by EventBridge on a schedule to:
 4. Send notifications for anomalies via Slack
 """
 
+import heapq
 import json
+import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from uuid import uuid4
 
 import boto3
+import httpx
 
 from slack_aws_cost_guardian.analysis.anomaly_detector import AnomalyDetector, DetectedAnomaly
 from slack_aws_cost_guardian.analysis.report_builder import build_daily_summary, build_weekly_summary
-from slack_aws_cost_guardian.collectors.anthropic_costs import AnthropicCostCollector
+from slack_aws_cost_guardian.collectors.anthropic_costs import (
+    AnthropicCostCollector,
+    iter_cost_report_pages,
+)
 from slack_aws_cost_guardian.collectors.aws_budgets import BudgetsCollector
-from slack_aws_cost_guardian.collectors.aws_cost_explorer import CostExplorerCollector
+from slack_aws_cost_guardian.collectors.aws_cost_explorer import (
+    CE_CLIENT_CONFIG,
+    CostExplorerCollector,
+)
 from slack_aws_cost_guardian.collectors.base import CostData
-from slack_aws_cost_guardian.config import load_config, load_guardian_context
+from slack_aws_cost_guardian.config import (
+    Config,
+    LLMConfig,
+    get_cached_config,
+    get_cached_guardian_context,
+)
+from slack_aws_cost_guardian.config.schema import RouteEvent
 from slack_aws_cost_guardian.llm import LLMClient, SYSTEM_PROMPT
 from slack_aws_cost_guardian.notifications.slack.formatter import SlackFormatter
 from slack_aws_cost_guardian.notifications.slack.webhook import SlackWebhookManager
@@ -34,6 +54,53 @@ from slack_aws_cost_guardian.storage.models import (
     CostSnapshot,
 )
 
+# Lambda application log levels that logging doesn't know by name
+_LAMBDA_LOG_LEVELS = {"TRACE": "DEBUG", "WARN": "WARNING", "FATAL": "CRITICAL"}
+
+
+def _resolve_log_level(lambda_level: str | None) -> str:
+    """Map a Lambda application log level onto a logging level name, defaulting to INFO."""
+    level = (lambda_level or "INFO").upper()
+    level = _LAMBDA_LOG_LEVELS.get(level, level)
+    return level if level in logging.getLevelNamesMapping() else "INFO"
+
+
+logger = logging.getLogger(__name__)
+# Follows the function's application log level when one is configured
+logger.setLevel(_resolve_log_level(os.environ.get("AWS_LAMBDA_LOG_LEVEL")))
+
+# Longest event JSON logged at INFO; the full event is only logged at DEBUG
+_EVENT_LOG_MAX_CHARS = 4096
+
+# Last successful Anthropic collection as (monotonic time, data)
+_anthropic_cache: tuple[float, CostData] | None = None
+
+_SEVERITY_RANK = {"info": 0, "warning": 1, "critical": 2}
+
+# Recent AI analyses keyed by (service, percent change rounded to 10, severity),
+# so clustered near-duplicate anomalies reuse one LLM call
+_ANALYSIS_CACHE_TTL_SECONDS = 3600.0
+_ANALYSIS_CACHE_MAX_ENTRIES = 256
+_analysis_cache: dict[tuple[str, float, str], tuple[float, str]] = {}
+# Alerts are analyzed on worker threads, so inserts (and pruning) are serialized
+_analysis_cache_lock = threading.Lock()
+
+# How long a warm container reuses the config secret fetched from Secrets Manager
+_SECRETS_CACHE_TTL_SECONDS = 900.0
+_secrets_cache: dict[str, tuple[float, dict[str, str]]] = {}
+# Clients holding a secret read once (LLM API key, Slack webhook URLs) are
+# rebuilt on the same TTL, so rotated or revoked secrets are picked up
+_llm_client_cache: dict[tuple[LLMConfig, str, str], tuple[float, LLMClient]] = {}
+_webhook_manager_cache: dict[tuple[str, str], tuple[float, SlackWebhookManager]] = {}
+
+# The cost report pages by cursor, so a backfill is split into date windows
+# (one default page of daily buckets each) that are fetched concurrently
+_ANTHROPIC_BACKFILL_WINDOW_DAYS = 7
+_ANTHROPIC_BACKFILL_MAX_WORKERS = 4
+
+# Per-thread storage for backfill workers (see _init_backfill_worker)
+_backfill_worker = threading.local()
+
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
@@ -54,8 +121,18 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     - skip_llm: bool - If true, skips AI analysis (faster testing)
     - dry_run: bool - Collect and analyze but don't store or notify
     """
-    print(f"Cost collector invoked at {datetime.now(UTC).isoformat()}")
-    print(f"Event: {json.dumps(event)}")
+    # One clock reading per invocation, so the snapshot and the budget alert
+    # dedupe agree on the date and hour
+    now = datetime.now(UTC)
+    logger.info("Cost collector invoked at %s", now.isoformat())
+    event_json = json.dumps(event)
+    if len(event_json) > _EVENT_LOG_MAX_CHARS:
+        logger.info(
+            "Event (%s chars, truncated): %s...", len(event_json), event_json[:_EVENT_LOG_MAX_CHARS]
+        )
+        logger.debug("Full event: %s", event_json)
+    else:
+        logger.info("Event: %s", event_json)
 
     # Test mode flags
     test_mode = event.get("test_mode", False)
@@ -83,262 +160,228 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         return _handle_backfill(
             days=int(backfill_days),
             test_mode=test_mode,
+            context=context,
         )
 
     if test_mode:
-        print("=" * 50)
-        print("*** RUNNING IN TEST MODE ***")
-        print(f"  force_anomaly: {force_anomaly}")
-        print(f"  skip_storage: {skip_storage}")
-        print(f"  skip_slack: {skip_slack}")
-        print(f"  skip_llm: {skip_llm}")
-        print("=" * 50)
-
-    # Load configuration
-    config = load_config()
-
-    # Get environment variables
-    table_name = os.environ.get("TABLE_NAME", f"cost-guardian-{config.environment}")
-    config_bucket = os.environ.get("CONFIG_BUCKET", "")
-    config_secret_name = os.environ.get(
-        "CONFIG_SECRET_NAME", f"cost-guardian/{config.environment}/config"
-    )
+        logger.info(
+            "*** RUNNING IN TEST MODE ***\n"
+            "  force_anomaly: %s\n  skip_storage: %s\n  skip_slack: %s\n  skip_llm: %s",
+            force_anomaly,
+            skip_storage,
+            skip_slack,
+            skip_llm,
+        )
 
-    # Initialize clients
-    storage = DynamoDBStorage(table_name)
-    cost_explorer = CostExplorerCollector(
-        region=config.aws.region,
-        cost_data_lag_days=config.collection.sources.cost_explorer.cost_data_lag_days,
+    ctx = _build_invocation_context(skip_llm=skip_llm)
+    config = ctx.config
+    storage = ctx.storage
+    slack_formatter = ctx.slack_formatter
+    llm_client = ctx.llm_client
+    guardian_context = ctx.guardian_context
+    config_secret_name = ctx.config_secret_name
+    if skip_llm:
+        logger.info("[SKIP] LLM analysis disabled")
+
+    # Initialize collectors
+    cost_explorer = _get_cost_explorer(
+        config.aws.region,
+        config.collection.sources.cost_explorer.cost_data_lag_days,
     )
-    budgets_collector = BudgetsCollector(region=config.aws.region)
+    budgets_collector = _get_budgets_collector(config.aws.region)
     anomaly_detector = AnomalyDetector(config.anomaly_detection)
-    slack_formatter = SlackFormatter()
 
-    # Load guardian context for AI analysis
-    guardian_context = ""
-    if config_bucket:
-        try:
-            guardian_context = load_guardian_context(
-                bucket_name=config_bucket,
-                s3_key=config.guardian_context.s3_key,
-            )
-            print(f"Loaded guardian context: {len(guardian_context)} chars")
-        except Exception as e:
-            print(f"Warning: Could not load guardian context: {e}")
+    # The collectors are independent network round trips, so run them
+    # concurrently and only block where each result is needed. The DynamoDB
+    # reads stay on this thread, overlapping with the collectors, because the
+    # shared storage holds a boto3 resource and resources aren't thread-safe
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        logger.info("Collecting cost data from AWS Cost Explorer...")
+        cost_data_future = executor.submit(
+            cost_explorer.collect,
+            lookback_days=config.collection.sources.cost_explorer.lookback_days,
+        )
 
-    # Initialize LLM client (if configured and not skipped)
-    llm_client: LLMClient | None = None
-    if config_secret_name and not skip_llm:
-        try:
-            llm_client = LLMClient(
-                config=config.llm,
-                secret_name=config_secret_name,
-                region=config.aws.region,
+        anthropic_future = None
+        if config.collection.sources.anthropic.enabled:
+            logger.info("Collecting Anthropic API costs...")
+            anthropic_future = executor.submit(
+                _collect_anthropic_costs_cached, config, bypass_cache=test_mode
             )
-            print(f"LLM client initialized (provider: {config.llm.provider})")
-        except Exception as e:
-            print(f"Warning: Could not initialize LLM client: {e}")
-    elif skip_llm:
-        print("[SKIP] LLM analysis disabled")
-
-    # Collect cost data from AWS
-    print("Collecting cost data from AWS Cost Explorer...")
-    cost_data = cost_explorer.collect(
-        lookback_days=config.collection.sources.cost_explorer.lookback_days
-    )
-    print(f"Collected AWS costs: ${cost_data.total_cost:.2f} total across {len(cost_data.cost_by_service)} services")
-
-    # Collect Anthropic costs if enabled
-    anthropic_data: CostData | None = None
-    if config.collection.sources.anthropic.enabled:
-        print("Collecting Anthropic API costs...")
-        anthropic_data = _collect_anthropic_costs(config)
-        if anthropic_data and anthropic_data.total_cost > 0:
-            print(f"Collected Anthropic costs: ${anthropic_data.total_cost:.2f} across {len(anthropic_data.cost_by_service)} services")
-        else:
-            print("No Anthropic costs found or collection failed")
 
-    if test_mode:
-        print("\nTop 5 AWS services by cost:")
-        sorted_services = sorted(cost_data.cost_by_service.items(), key=lambda x: x[1], reverse=True)
-        for service, cost in sorted_services[:5]:
-            print(f"  - {service}: ${cost:.2f}")
-        if anthropic_data and anthropic_data.cost_by_service:
-            print("\nAnthropic services:")
-            for service, cost in anthropic_data.cost_by_service.items():
-                print(f"  - {service}: ${cost:.2f}")
-
-    # Collect budget information
-    budget_info = None
-    if config.collection.sources.budgets.enabled:
-        print("Collecting budget information...")
-        budgets = budgets_collector.collect()
-        if budgets:
-            # Use first budget for now (can be enhanced to support multiple)
-            b = budgets[0]
-            budget_info = BudgetStatus(
-                monthly_budget=b.limit,
-                monthly_spent=b.actual_spend,
-                monthly_percent=b.percentage_used,
-            )
-            print(f"Budget status: {b.percentage_used:.1f}% used (${b.actual_spend:.2f} of ${b.limit:.2f})")
-        else:
-            print("No budgets found")
+        budgets_future = None
+        if config.collection.sources.budgets.enabled:
+            logger.info("Collecting budget information...")
+            budgets_future = executor.submit(budgets_collector.collect)
 
-    # Merge costs from all providers and create snapshot
-    print("Creating cost snapshot...")
-    merged_cost_data = _merge_provider_costs(cost_data, anthropic_data)
-    snapshot = _create_snapshot(merged_cost_data, budget_info, config.environment)
+        # Get active changes to filter acknowledged anomalies
+        active_changes = storage.get_active_changes()
+        logger.info("Found %s active acknowledged changes", len(active_changes))
 
-    # Store snapshot (unless skip_storage)
-    if not skip_storage:
-        storage.put_snapshot(snapshot)
-        print(f"Stored snapshot: {snapshot.snapshot_id}")
-    else:
-        print(f"[SKIP] Would store snapshot: {snapshot.snapshot_id}")
+        cost_data = cost_data_future.result()
+        logger.info(
+            "Collected AWS costs: $%.2f total across %s services",
+            cost_data.total_cost,
+            len(cost_data.cost_by_service),
+        )
 
-    # Get historical snapshots for anomaly detection
-    print("Loading historical data for baseline...")
-    historical = storage.get_recent_snapshots(
-        days=config.anomaly_detection.baseline_days,
-        account_id=cost_data.account_id,
-    )
-    print(f"Loaded {len(historical)} historical snapshots")
+        # Historical snapshots need the account ID from the collection. Resolve
+        # the baseline before storing so it never includes this snapshot
+        logger.info("Loading historical data for baseline...")
+        historical = storage.get_recent_snapshots(
+            days=config.anomaly_detection.baseline_days,
+            account_id=cost_data.account_id,
+        )
+        logger.info("Loaded %s historical snapshots", len(historical))
+
+        # Collect Anthropic costs if enabled
+        anthropic_data: CostData | None = None
+        if anthropic_future is not None:
+            anthropic_data = anthropic_future.result()
+            if anthropic_data and anthropic_data.total_cost > 0:
+                logger.info(
+                    "Collected Anthropic costs: $%.2f across %s services",
+                    anthropic_data.total_cost,
+                    len(anthropic_data.cost_by_service),
+                )
+            else:
+                logger.info("No Anthropic costs found or collection failed")
 
-    # Get active changes to filter acknowledged anomalies
-    active_changes = storage.get_active_changes()
-    print(f"Found {len(active_changes)} active acknowledged changes")
+        if test_mode:
+            top_services = heapq.nlargest(5, cost_data.cost_by_service.items(), key=lambda x: x[1])
+            lines = ["Top 5 AWS services by cost:"]
+            lines.extend(f"  - {service}: ${cost:.2f}" for service, cost in top_services)
+            if anthropic_data and anthropic_data.cost_by_service:
+                lines.append("Anthropic services:")
+                lines.extend(
+                    f"  - {service}: ${cost:.2f}"
+                    for service, cost in anthropic_data.cost_by_service.items()
+                )
+            logger.info("\n".join(lines))
+
+        # Collect budget information
+        budget_info = None
+        if budgets_future is not None:
+            budgets = budgets_future.result()
+            if budgets:
+                # Use first budget for now (can be enhanced to support multiple)
+                b = budgets[0]
+                budget_info = BudgetStatus(
+                    monthly_budget=b.limit,
+                    monthly_spent=b.actual_spend,
+                    monthly_percent=b.percentage_used,
+                )
+                logger.info(
+                    "Budget status: %.1f%% used ($%.2f of $%.2f)",
+                    b.percentage_used,
+                    b.actual_spend,
+                    b.limit,
+                )
+            else:
+                logger.info("No budgets found")
+
+    # Merge costs from all providers and create snapshot
+    logger.info("Creating cost snapshot...")
+    merged_cost_data = _merge_provider_costs(cost_data, anthropic_data)
+    snapshot = _create_snapshot(merged_cost_data, budget_info, config.environment, now)
 
     # Detect anomalies
-    print("Running anomaly detection...")
+    logger.info("Running anomaly detection...")
     anomalies = anomaly_detector.detect(snapshot, historical, active_changes)
-    print(f"Detected {len(anomalies)} anomalies")
+    logger.info("Detected %s anomalies", len(anomalies))
 
     # Force a test anomaly if requested
     if force_anomaly:
         test_anomaly = _create_test_anomaly(cost_data)
         anomalies.append(test_anomaly)
-        print(f"[TEST] Injected fake anomaly: {test_anomaly.description}")
+        logger.info("[TEST] Injected fake anomaly: %s", test_anomaly.description)
 
     if test_mode and anomalies:
-        print("\nDetected anomalies:")
-        for a in anomalies:
-            print(f"  - [{a.severity.upper()}] {a.description}")
-
-    # Update snapshot with anomalies (unless skip_storage)
-    if anomalies and not skip_storage:
-        snapshot.anomalies_detected = [
-            AnomalyInfo(
-                service=a.service,
-                amount=a.absolute_change,
-                percent_change=a.percent_change,
-                severity=a.severity,
-                baseline_cost=a.baseline_cost,
-            )
-            for a in anomalies
-        ]
-        storage.put_snapshot(snapshot)
+        logger.info(
+            "Detected anomalies:\n%s",
+            "\n".join(f"  - [{a.severity.upper()}] {a.description}" for a in anomalies),
+        )
 
-    # Send Slack notifications for anomalies
-    notifications_sent = 0
-    if config.slack.enabled and anomalies and not skip_slack:
-        print("Sending Slack notifications...")
-        try:
-            webhook_manager = SlackWebhookManager(
-                secret_name=config_secret_name,
-                region=config.aws.region,
-            )
+    # Attach anomalies so the snapshot is written once, complete. The fields
+    # come from DetectedAnomaly, so skip validation and only coerce the numbers
+    # that may be ints (e.g. new services report a flat 100% change)
+    snapshot.anomalies_detected = [
+        AnomalyInfo.model_construct(
+            service=a.service,
+            amount=float(a.absolute_change),
+            percent_change=float(a.percent_change),
+            severity=a.severity,
+            baseline_cost=float(a.baseline_cost),
+        )
+        for a in anomalies
+    ]
 
-            for anomaly in anomalies:
-                # Determine which channel to use based on severity
-                channel_key = (
-                    config.slack.channels["critical"].webhook_secret_key
-                    if anomaly.severity == "critical"
-                    else config.slack.channels["heartbeat"].webhook_secret_key
+    # Store snapshot (unless skip_storage)
+    if not skip_storage:
+        storage.put_snapshot(snapshot)
+        logger.info("Stored snapshot: %s", snapshot.snapshot_id)
+    else:
+        logger.info("[SKIP] Would store snapshot: %s", snapshot.snapshot_id)
+
+    # Anomaly and budget alerts are independent and each may wait on the LLM
+    # and a webhook, so the budget alert is sent alongside the anomaly alerts.
+    # The budget alert's dedupe lookup is the only storage use from here on
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        budget_alert_future = None
+        if config.slack.enabled and not skip_slack:
+            # Force a test budget alert if requested
+            if force_budget_alert in ("warning", "critical"):
+                test_budget_info = BudgetStatus(
+                    monthly_budget=budget_info.monthly_budget if budget_info else 1000.0,
+                    monthly_spent=budget_info.monthly_spent if budget_info else 850.0,
+                    monthly_percent=85.0 if force_budget_alert == "warning" else 105.0,
                 )
-
-                # Generate alert ID
-                alert_id = str(uuid4())
-
-                # Generate AI analysis (graceful degradation if fails)
-                ai_analysis = None
-                if llm_client:
-                    try:
-                        # Build context for the LLM
-                        historical_summary = _build_historical_summary(historical, anomaly.service)
-                        anomaly_data = {
-                            "service": anomaly.service,
-                            "current_cost": anomaly.current_cost,
-                            "baseline_cost": anomaly.baseline_cost,
-                            "absolute_change": anomaly.absolute_change,
-                            "percent_change": anomaly.percent_change,
-                            "severity": anomaly.severity,
-                            "is_new_service": anomaly.is_new_service,
-                        }
-
-                        ai_analysis = llm_client.analyze_anomaly(
-                            anomaly_data=anomaly_data,
-                            historical_context=historical_summary,
-                            user_context=guardian_context,
-                            system_prompt=SYSTEM_PROMPT,
-                        )
-
-                        if ai_analysis:
-                            print(f"Generated AI analysis for {anomaly.service}")
-                    except Exception as e:
-                        print(f"AI analysis failed for {anomaly.service}: {e}")
-
-                # Format and send message
-                message = slack_formatter.format_anomaly_alert(
-                    anomaly=anomaly,
-                    alert_id=alert_id,
-                    ai_analysis=ai_analysis,
+                logger.info("[TEST] Forcing %s budget alert", force_budget_alert)
+                budget_alert_future = executor.submit(
+                    _send_budget_alert_direct,
+                    budget_info=test_budget_info,
+                    threshold_type=force_budget_alert,
+                    config=config,
+                    config_secret_name=config_secret_name,
+                    llm_client=llm_client,
+                    guardian_context=guardian_context,
+                    test_mode=test_mode,
+                )
+            elif budget_info:
+                # Check budget thresholds and send alerts
+                budget_alert_future = executor.submit(
+                    _check_and_send_budget_alert,
+                    budget_info=budget_info,
+                    config=config,
+                    storage=storage,
+                    now=now,
+                    config_secret_name=config_secret_name,
+                    llm_client=llm_client,
+                    guardian_context=guardian_context,
+                    test_mode=test_mode,
                 )
 
-                webhook_manager.send_to_channel(channel_key, message)
-                notifications_sent += 1
-                print(f"Sent alert for {anomaly.service}: {anomaly.description}")
-
-        except Exception as e:
-            print(f"Error sending Slack notifications: {e}")
-            if test_mode:
-                import traceback
-                traceback.print_exc()
-    elif anomalies and skip_slack:
-        print(f"[SKIP] Would send {len(anomalies)} Slack notifications")
-
-    # Check budget thresholds and send alerts
-    budget_alert_sent = None
-    if config.slack.enabled and not skip_slack:
-        # Force a test budget alert if requested
-        if force_budget_alert in ("warning", "critical"):
-            test_budget_info = BudgetStatus(
-                monthly_budget=budget_info.monthly_budget if budget_info else 1000.0,
-                monthly_spent=budget_info.monthly_spent if budget_info else 850.0,
-                monthly_percent=85.0 if force_budget_alert == "warning" else 105.0,
-            )
-            print(f"[TEST] Forcing {force_budget_alert} budget alert")
-            budget_alert_sent = _send_budget_alert_direct(
-                budget_info=test_budget_info,
-                threshold_type=force_budget_alert,
+        # Send Slack notifications for anomalies
+        notifications_sent = 0
+        if config.slack.enabled and anomalies and not skip_slack:
+            notifications_sent = _send_anomaly_alerts(
+                anomalies=anomalies,
+                historical=historical,
                 config=config,
                 config_secret_name=config_secret_name,
                 llm_client=llm_client,
                 guardian_context=guardian_context,
+                slack_formatter=slack_formatter,
                 test_mode=test_mode,
             )
-        elif budget_info:
-            budget_alert_sent = _check_and_send_budget_alert(
-                budget_info=budget_info,
-                config=config,
-                storage=storage,
-                config_secret_name=config_secret_name,
-                llm_client=llm_client,
-                guardian_context=guardian_context,
-                test_mode=test_mode,
-            )
-        if budget_alert_sent:
-            notifications_sent += 1
+        elif anomalies and skip_slack:
+            logger.info("[SKIP] Would send %s Slack notifications", len(anomalies))
+
+        budget_alert_sent = None
+        if budget_alert_future is not None:
+            budget_alert_sent = budget_alert_future.result()
+            if budget_alert_sent:
+                notifications_sent += 1
 
     # Return summary
     result = {
@@ -355,18 +398,178 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         },
     }
 
-    print(f"\nCompleted: {json.dumps(result['body'], indent=2)}")
+    logger.info("Completed: %s", json.dumps(result["body"], indent=2 if test_mode else None))
     return result
 
 
+@dataclass
+class InvocationContext:
+    """Configuration and clients shared by every invocation mode."""
+
+    config: Config
+    storage: DynamoDBStorage
+    slack_formatter: SlackFormatter
+    llm_client: LLMClient | None
+    guardian_context: str
+    config_secret_name: str
+
+
+def _build_invocation_context(skip_llm: bool) -> InvocationContext:
+    """
+    Build the shared configuration and clients for an invocation.
+
+    Config, storage and the LLM client come from module-level caches, so on
+    a warm container this does little beyond refreshing the guardian context.
+
+    Args:
+        skip_llm: If True, skips the LLM client and guardian context.
+
+    Returns:
+        InvocationContext for the current invocation.
+    """
+    config = get_cached_config()
+
+    # Get environment variables
+    table_name = os.environ.get("TABLE_NAME", f"cost-guardian-{config.environment}")
+    config_bucket = os.environ.get("CONFIG_BUCKET", "")
+    config_secret_name = os.environ.get(
+        "CONFIG_SECRET_NAME", f"cost-guardian/{config.environment}/config"
+    )
+
+    guardian_context = ""
+    llm_client: LLMClient | None = None
+
+    if not skip_llm:
+        # Initialize LLM client (if configured)
+        if config_secret_name:
+            try:
+                llm_client = _get_llm_client(config.llm, config_secret_name, config.aws.region)
+                logger.info("LLM client initialized (provider: %s)", config.llm.provider)
+            except Exception as e:
+                logger.warning("Could not initialize LLM client: %s", e)
+
+        # Load guardian context for AI analysis
+        if config_bucket:
+            try:
+                guardian_context = get_cached_guardian_context(
+                    bucket_name=config_bucket,
+                    s3_key=config.guardian_context.s3_key,
+                )
+                logger.info("Loaded guardian context: %s chars", len(guardian_context))
+            except Exception as e:
+                logger.warning("Could not load guardian context: %s", e)
+
+    return InvocationContext(
+        config=config,
+        storage=_get_storage(table_name),
+        slack_formatter=SlackFormatter(),
+        llm_client=llm_client,
+        guardian_context=guardian_context,
+        config_secret_name=config_secret_name,
+    )
+
+
+# Clients are cached at module level so warm Lambda invocations reuse them
+# (and their connection pools) instead of rebuilding them every call
+@lru_cache(maxsize=None)
+def _get_storage(table_name: str) -> DynamoDBStorage:
+    """Get the DynamoDB storage client for a table."""
+    return DynamoDBStorage(table_name)
+
+
+@lru_cache(maxsize=None)
+def _get_cost_explorer(region: str, cost_data_lag_days: int) -> CostExplorerCollector:
+    """Get the Cost Explorer collector for a region."""
+    return CostExplorerCollector(region=region, cost_data_lag_days=cost_data_lag_days)
+
+
+@lru_cache(maxsize=None)
+def _get_budgets_collector(region: str) -> BudgetsCollector:
+    """Get the Budgets collector for a region."""
+    return BudgetsCollector(region=region)
+
+
+@lru_cache(maxsize=1)
+def _get_anthropic_http_client() -> httpx.Client:
+    """Get the HTTP client for Anthropic API calls, keeping its connections warm."""
+    return httpx.Client(timeout=30.0)
+
+
+def _get_llm_client(llm_config: LLMConfig, secret_name: str, region: str) -> LLMClient:
+    """
+    Get the LLM client, reusing a recent one.
+
+    The client keeps its provider (and API key) once created, so it is rebuilt
+    on the same schedule as the config secret to pick up a rotated key.
+    """
+    cache_key = (llm_config, secret_name, region)
+    now = time.monotonic()
+    cached = _llm_client_cache.get(cache_key)
+    if cached is not None and now - cached[0] < _SECRETS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    llm_client = LLMClient(config=llm_config, secret_name=secret_name, region=region)
+    _llm_client_cache[cache_key] = (now, llm_client)
+    return llm_client
+
+
+def _get_webhook_manager(secret_name: str, region: str) -> SlackWebhookManager:
+    """
+    Get the Slack webhook manager, reusing a recent one.
+
+    The manager keeps each channel's webhook URL once read, so it is rebuilt
+    on the same schedule as the config secret to pick up a rotated webhook.
+    """
+    cache_key = (secret_name, region)
+    now = time.monotonic()
+    cached = _webhook_manager_cache.get(cache_key)
+    if cached is not None and now - cached[0] < _SECRETS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    webhook_manager = SlackWebhookManager(
+        secret_name=secret_name,
+        region=region,
+        secrets_client=_get_secrets_client(region),
+    )
+    _webhook_manager_cache[cache_key] = (now, webhook_manager)
+    return webhook_manager
+
+
+@lru_cache(maxsize=None)
+def _get_secrets_client(region: str) -> Any:
+    """Get the Secrets Manager client for a region."""
+    return boto3.client("secretsmanager", region_name=region)
+
+
+def _get_config_secrets(secret_name: str, region: str) -> dict[str, str]:
+    """
+    Get the config secret's values, reusing a recent fetch.
+
+    Args:
+        secret_name: Secrets Manager secret name.
+        region: AWS region of the secret.
+
+    Returns:
+        Dict of the secret's key/value pairs.
+    """
+    now = time.monotonic()
+    cached = _secrets_cache.get(secret_name)
+    if cached is not None and now - cached[0] < _SECRETS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    secret_response = _get_secrets_client(region).get_secret_value(SecretId=secret_name)
+    secrets = json.loads(secret_response["SecretString"])
+    _secrets_cache[secret_name] = (now, secrets)
+    return secrets
+
+
 def _create_snapshot(
     cost_data: Any,
     budget_info: BudgetStatus | None,
     environment: str,
+    now: datetime,
 ) -> CostSnapshot:
-    """Create a CostSnapshot from collected data."""
-    now = datetime.now(UTC)
-
+    """Create a CostSnapshot from collected data, taken at now."""
     # Calculate TTL based on environment (90 days for daily snapshots)
     ttl_days = 90 if environment != "dev" else 7
     ttl = int((now + timedelta(days=ttl_days)).timestamp())
@@ -423,35 +626,234 @@ def _create_test_anomaly(cost_data: Any) -> DetectedAnomaly:
     )
 
 
-def _build_historical_summary(snapshots: list[CostSnapshot], service: str) -> str:
+def _send_anomaly_alerts(
+    anomalies: list[DetectedAnomaly],
+    historical: list[CostSnapshot],
+    config: Any,
+    config_secret_name: str,
+    llm_client: LLMClient | None,
+    guardian_context: str,
+    slack_formatter: SlackFormatter,
+    test_mode: bool,
+) -> int:
+    """
+    Send a Slack alert (with AI analysis when available) for each anomaly.
+
+    Args:
+        anomalies: Detected anomalies to alert on.
+        historical: Historical snapshots used for the AI context.
+        config: Application configuration.
+        config_secret_name: Secrets Manager secret name.
+        llm_client: Optional LLM client for AI analysis.
+        guardian_context: User context for AI.
+        slack_formatter: Slack message formatter.
+        test_mode: Whether running in test mode.
+
+    Returns:
+        Number of alerts sent.
+    """
+    notifications_sent = 0
+    logger.info("Sending Slack notifications...")
+    try:
+        webhook_manager = _get_webhook_manager(config_secret_name, config.aws.region)
+
+        # Each alert is an independent LLM call plus webhook POST, so fan
+        # them out; the history summary only depends on the service
+        costs_by_date = _index_costs_by_date(historical)
+        historical_summaries = {
+            service: _build_historical_summary(costs_by_date, service)
+            for service in {a.service for a in anomalies}
+        }
+
+        with ThreadPoolExecutor(max_workers=min(8, len(anomalies))) as executor:
+            futures = {
+                executor.submit(
+                    _process_anomaly,
+                    anomaly=anomaly,
+                    historical_summary=historical_summaries[anomaly.service],
+                    guardian_context=guardian_context,
+                    llm_client=llm_client,
+                    slack_formatter=slack_formatter,
+                    webhook_manager=webhook_manager,
+                    config=config,
+                    use_cache=not test_mode,
+                ): anomaly
+                for anomaly in anomalies
+            }
+
+            for future in as_completed(futures):
+                anomaly = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(
+                        "Error sending alert for %s: %s", anomaly.service, e, exc_info=test_mode
+                    )
+                    continue
+                notifications_sent += 1
+                logger.info("Sent alert for %s: %s", anomaly.service, anomaly.description)
+
+    except Exception as e:
+        logger.error("Error sending Slack notifications: %s", e, exc_info=test_mode)
+
+    return notifications_sent
+
+
+def _process_anomaly(
+    anomaly: DetectedAnomaly,
+    historical_summary: str,
+    guardian_context: str,
+    llm_client: LLMClient | None,
+    slack_formatter: SlackFormatter,
+    webhook_manager: SlackWebhookManager,
+    config: Any,
+    use_cache: bool = True,
+) -> None:
+    """
+    Analyze a single anomaly and send its Slack alert.
+
+    Args:
+        anomaly: The detected anomaly.
+        historical_summary: Recent cost history for the anomaly's service.
+        guardian_context: User context for AI.
+        llm_client: Optional LLM client for AI analysis.
+        slack_formatter: Slack message formatter.
+        webhook_manager: Slack webhook manager.
+        config: Application configuration.
+        use_cache: Whether to reuse a recent analysis of a similar anomaly.
+
+    Raises:
+        SlackWebhookError: If the alert fails to send.
+    """
+    # Determine which channel to use based on severity
+    channel_key = _webhook_key_for_event(
+        config, "anomaly_critical" if anomaly.severity == "critical" else "anomaly_warning"
+    )
+
+    # Generate alert ID
+    alert_id = str(uuid4())
+
+    # Generate AI analysis (graceful degradation if fails)
+    ai_analysis = None
+    analyze = (
+        llm_client is not None
+        and _SEVERITY_RANK[anomaly.severity] >= _SEVERITY_RANK[config.llm.min_severity]
+    )
+
+    cache_key = (anomaly.service, round(anomaly.percent_change, -1), anomaly.severity)
+    if analyze and use_cache:
+        cached = _analysis_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _ANALYSIS_CACHE_TTL_SECONDS:
+            ai_analysis = cached[1]
+            analyze = False
+            logger.info("Reusing recent AI analysis for %s", anomaly.service)
+
+    if analyze:
+        try:
+            # Build context for the LLM
+            anomaly_data = {
+                "service": anomaly.service,
+                "current_cost": anomaly.current_cost,
+                "baseline_cost": anomaly.baseline_cost,
+                "absolute_change": anomaly.absolute_change,
+                "percent_change": anomaly.percent_change,
+                "severity": anomaly.severity,
+                "is_new_service": anomaly.is_new_service,
+            }
+
+            ai_analysis = llm_client.analyze_anomaly(
+                anomaly_data=anomaly_data,
+                historical_context=historical_summary,
+                user_context=guardian_context,
+                system_prompt=SYSTEM_PROMPT,
+            )
+
+            if ai_analysis:
+                _cache_analysis(cache_key, ai_analysis)
+                logger.info("Generated AI analysis for %s", anomaly.service)
+        except Exception as e:
+            logger.warning("AI analysis failed for %s: %s", anomaly.service, e)
+
+    # Format and send message
+    message = slack_formatter.format_anomaly_alert(
+        anomaly=anomaly,
+        alert_id=alert_id,
+        ai_analysis=ai_analysis,
+    )
+
+    webhook_manager.send_to_channel(channel_key, message)
+
+
+def _cache_analysis(cache_key: tuple[str, float, str], ai_analysis: str) -> None:
+    """
+    Store an AI analysis, dropping expired entries and the oldest beyond the cap.
+
+    Args:
+        cache_key: (service, percent change rounded to 10, severity).
+        ai_analysis: The generated analysis text.
+    """
+    now = time.monotonic()
+    with _analysis_cache_lock:
+        for key in [
+            key
+            for key, (cached_at, _) in _analysis_cache.items()
+            if now - cached_at >= _ANALYSIS_CACHE_TTL_SECONDS
+        ]:
+            del _analysis_cache[key]
+
+        # Re-insert so the dict stays ordered oldest first
+        _analysis_cache.pop(cache_key, None)
+        _analysis_cache[cache_key] = (now, ai_analysis)
+        while len(_analysis_cache) > _ANALYSIS_CACHE_MAX_ENTRIES:
+            del _analysis_cache[next(iter(_analysis_cache))]
+
+
+def _webhook_key_for_event(config: Any, event: RouteEvent) -> str:
+    """Return the webhook secret key of the channel config.routing sends an event to."""
+    return config.slack.channels.webhook_secret_key_for_channel(config.routing.route(event))
+
+
+def _index_costs_by_date(snapshots: list[CostSnapshot]) -> dict[str, dict[str, float]]:
+    """
+    Index snapshot service costs by date.
+
+    Args:
+        snapshots: Recent cost snapshots, newest first.
+
+    Returns:
+        Dict mapping each date to its cost_by_service, newest first. When a
+        date has several snapshots, the first one seen is kept.
+    """
+    costs_by_date: dict[str, dict[str, float]] = {}
+    for s in snapshots:
+        costs_by_date.setdefault(s.date, s.cost_by_service)
+    return costs_by_date
+
+
+def _build_historical_summary(costs_by_date: dict[str, dict[str, float]], service: str) -> str:
     """
     Build a brief historical context summary for the LLM.
 
     Args:
-        snapshots: List of recent cost snapshots.
+        costs_by_date: Service costs by date, as built by _index_costs_by_date.
         service: AWS service name to summarize.
 
     Returns:
         A string summary of recent costs for the service.
     """
-    if not snapshots:
+    if not costs_by_date:
         return "No historical data available."
 
     # Get last 7 days of costs for this service
     service_costs = []
-    seen_dates = set()
-
-    for s in snapshots:
-        if s.date in seen_dates:
-            continue
-        seen_dates.add(s.date)
 
-        cost = s.cost_by_service.get(service, 0)
+    for date, cost_by_service in costs_by_date.items():
+        cost = cost_by_service.get(service, 0)
         if cost > 0:
-            service_costs.append(f"  {s.date}: ${cost:.2f}")
+            service_costs.append(f"  {date}: ${cost:.2f}")
 
-        if len(service_costs) >= 7:
-            break
+            if len(service_costs) >= 7:
+                break
 
     if not service_costs:
         return f"No recent cost history for {service}."
@@ -479,62 +881,38 @@ def _handle_report_generation(
     Returns:
         Lambda response dict.
     """
-    print(f"Generating {report_type} report...")
-
-    # Load configuration
-    config = load_config()
-
-    # Get environment variables
-    table_name = os.environ.get("TABLE_NAME", f"cost-guardian-{config.environment}")
-    config_bucket = os.environ.get("CONFIG_BUCKET", "")
-    config_secret_name = os.environ.get(
-        "CONFIG_SECRET_NAME", f"cost-guardian/{config.environment}/config"
-    )
-
-    # Initialize storage
-    storage = DynamoDBStorage(table_name)
-    slack_formatter = SlackFormatter()
-
-    # Load guardian context for AI analysis
-    guardian_context = ""
-    if config_bucket:
-        try:
-            guardian_context = load_guardian_context(
-                bucket_name=config_bucket,
-                s3_key=config.guardian_context.s3_key,
-            )
-            print(f"Loaded guardian context: {len(guardian_context)} chars")
-        except Exception as e:
-            print(f"Warning: Could not load guardian context: {e}")
+    logger.info("Generating %s report...", report_type)
 
-    # Initialize LLM client (if configured and not skipped)
-    llm_client: LLMClient | None = None
-    if config_secret_name and not skip_llm:
-        try:
-            llm_client = LLMClient(
-                config=config.llm,
-                secret_name=config_secret_name,
-                region=config.aws.region,
-            )
-            print(f"LLM client initialized (provider: {config.llm.provider})")
-        except Exception as e:
-            print(f"Warning: Could not initialize LLM client: {e}")
+    ctx = _build_invocation_context(skip_llm=skip_llm)
+    config = ctx.config
+    storage = ctx.storage
+    slack_formatter = ctx.slack_formatter
+    llm_client = ctx.llm_client
+    guardian_context = ctx.guardian_context
+    config_secret_name = ctx.config_secret_name
 
     # Generate the appropriate summary
     if report_type == "daily":
         summary = build_daily_summary(storage)
         fallback_note = " (fallback to today)" if summary.get("used_fallback") else ""
-        print(f"Built daily summary for {summary.get('date')}{fallback_note}: ${summary.get('total_cost', 0):.2f}")
+        logger.info(
+            "Built daily summary for %s%s: $%.2f",
+            summary.get("date"),
+            fallback_note,
+            summary.get("total_cost", 0),
+        )
     else:  # weekly
         summary = build_weekly_summary(storage)
-        print(
-            f"Built weekly summary for {summary.get('start_date')} to {summary.get('end_date')}: "
-            f"${summary.get('total_cost', 0):.2f}"
+        logger.info(
+            "Built weekly summary for %s to %s: $%.2f",
+            summary.get("start_date"),
+            summary.get("end_date"),
+            summary.get("total_cost", 0),
         )
 
     # Check if we have data
     if not summary.get("has_data"):
-        print(f"No data available for {report_type} report")
+        logger.info("No data available for %s report", report_type)
         return {
             "statusCode": 200,
             "body": {
@@ -562,62 +940,15 @@ def _handle_report_generation(
                 )
 
             if ai_insight:
-                print(f"Generated AI insight for {report_type} report")
+                logger.info("Generated AI insight for %s report", report_type)
         except Exception as e:
-            print(f"AI insight generation failed: {e}")
+            logger.warning("AI insight generation failed: %s", e)
 
     # Format the Slack message
     if report_type == "daily":
-        # For daily, we need to convert to CostData format
-        # Use the format_daily_report method which expects CostData
-        from slack_aws_cost_guardian.collectors.base import CostData, DailyCost, ForecastInfo
-        from slack_aws_cost_guardian.storage.models import BudgetStatus
-
-        top_services_dict = {s["service"]: s["cost"] for s in summary.get("top_services", [])}
-
-        # Convert recent_daily_costs to DailyCost objects for the formatter
-        recent_daily_costs = [
-            DailyCost(date=dc["date"], cost=dc["cost"])
-            for dc in summary.get("recent_daily_costs", [])
-        ]
-
-        cost_data = CostData(
-            start_date=summary.get("date", ""),
-            end_date=summary.get("date", ""),
-            collection_timestamp=datetime.now(UTC).isoformat(),
-            account_id="",
-            total_cost=summary.get("total_cost", 0),
-            cost_by_service=top_services_dict,
-            daily_costs=recent_daily_costs,  # For incomplete data footnote
-            trend=summary.get("trend", "unknown"),
-            average_daily_cost=summary.get("total_cost", 0),
-        )
-
-        if summary.get("forecast", 0) > 0:
-            cost_data.forecast = ForecastInfo(
-                forecasted_total=summary.get("forecast", 0),
-                current_spend=summary.get("budget_spent", 0),
-                days_remaining=0,
-                daily_average=0,
-                month="",
-            )
-
-        budget_status = None
-        if summary.get("budget_monthly", 0) > 0:
-            budget_status = BudgetStatus(
-                monthly_budget=summary.get("budget_monthly", 0),
-                monthly_spent=summary.get("budget_spent", 0),
-                monthly_percent=summary.get("budget_percent", 0),
-            )
-
-        message = slack_formatter.format_daily_report(
-            cost_data=cost_data,
-            budget_status=budget_status,
+        message = slack_formatter.format_daily_report_from_summary(
+            summary=summary,
             ai_insight=ai_insight,
-            report_date=summary.get("date"),
-            cost_data_date=summary.get("cost_data_date"),
-            provider_costs=summary.get("provider_costs"),
-            used_fallback=summary.get("used_fallback", False),
         )
     else:  # weekly
         message = slack_formatter.format_weekly_report(
@@ -625,28 +956,22 @@ def _handle_report_generation(
             ai_insight=ai_insight,
         )
 
-    # Send to Slack heartbeat channel
+    # Send to the report's routed Slack channel
     notification_sent = False
     if config.slack.enabled and not skip_slack:
-        print("Sending report to Slack...")
+        logger.info("Sending report to Slack...")
         try:
-            webhook_manager = SlackWebhookManager(
-                secret_name=config_secret_name,
-                region=config.aws.region,
-            )
+            webhook_manager = _get_webhook_manager(config_secret_name, config.aws.region)
 
-            channel_key = config.slack.channels["heartbeat"].webhook_secret_key
+            channel_key = _webhook_key_for_event(config, f"{report_type}_report")
             webhook_manager.send_to_channel(channel_key, message)
             notification_sent = True
-            print(f"Sent {report_type} report to Slack")
+            logger.info("Sent %s report to Slack", report_type)
 
         except Exception as e:
-            print(f"Error sending Slack notification: {e}")
-            if test_mode:
-                import traceback
-                traceback.print_exc()
+            logger.error("Error sending Slack notification: %s", e, exc_info=test_mode)
     elif skip_slack:
-        print(f"[SKIP] Would send {report_type} report to Slack")
+        logger.info("[SKIP] Would send %s report to Slack", report_type)
 
     # Return summary
     body: dict[str, Any] = {
@@ -667,13 +992,14 @@ def _handle_report_generation(
 
     result = {"statusCode": 200, "body": body}
 
-    print(f"\nCompleted: {json.dumps(result['body'], indent=2)}")
+    logger.info("Completed: %s", json.dumps(result["body"], indent=2 if test_mode else None))
     return result
 
 
 def _handle_backfill(
     days: int,
     test_mode: bool,
+    context: Any = None,
 ) -> dict[str, Any]:
     """
     Backfill historical cost data from AWS Cost Explorer and optionally Anthropic.
@@ -685,99 +1011,130 @@ def _handle_backfill(
     Args:
         days: Number of days to backfill.
         test_mode: Whether running in test mode.
+        context: Lambda context, used to read the account ID from the function ARN.
 
     Returns:
         Lambda response dict.
     """
-    print(f"Backfilling {days} days of historical data...")
+    logger.info("Backfilling %s days of historical data...", days)
 
-    # Load configuration
-    config = load_config()
-
-    # Get environment variables
-    table_name = os.environ.get("TABLE_NAME", f"cost-guardian-{config.environment}")
+    # Backfill makes no LLM calls, so skip the LLM client and guardian context
+    ctx = _build_invocation_context(skip_llm=True)
+    config = ctx.config
+    storage = ctx.storage
 
     # Initialize clients
-    storage = DynamoDBStorage(table_name)
-    cost_explorer = boto3.client("ce", region_name=config.aws.region)
-    sts = boto3.client("sts", region_name=config.aws.region)
+    cost_explorer = boto3.client("ce", region_name=config.aws.region, config=CE_CLIENT_CONFIG)
 
-    # Get account ID
-    account_id = sts.get_caller_identity()["Account"]
+    # Get account ID from the invoked function ARN
+    # (arn:aws:lambda:region:account:function:name), only asking STS outside Lambda
+    account_id = _account_id_from_context(context)
+    if not account_id:
+        sts = boto3.client("sts", region_name=config.aws.region)
+        account_id = sts.get_caller_identity()["Account"]
 
     # Calculate date range
-    today = datetime.now(UTC).date()
+    now = datetime.now(UTC)
+    today = now.date()
     start_date = today - timedelta(days=days)
     end_date = today  # Cost Explorer end date is exclusive
 
-    print(f"Querying Cost Explorer for {start_date} to {end_date}...")
+    logger.info("Querying Cost Explorer for %s to %s...", start_date, end_date)
 
-    # Query Cost Explorer for daily costs by service
+    # Query Cost Explorer for daily costs by service. Long ranges come back
+    # in pages (Cost Explorer has no boto3 paginator), and a day's service
+    # groups can continue onto the next page, so collect them by date
+    groups_by_date: dict[str, list[dict]] = {}
+    request: dict[str, Any] = {
+        "TimePeriod": {
+            "Start": start_date.isoformat(),
+            "End": end_date.isoformat(),
+        },
+        "Granularity": "DAILY",
+        "Metrics": ["UnblendedCost"],
+        "GroupBy": [
+            {"Type": "DIMENSION", "Key": "SERVICE"},
+        ],
+    }
     try:
-        response = cost_explorer.get_cost_and_usage(
-            TimePeriod={
-                "Start": start_date.isoformat(),
-                "End": end_date.isoformat(),
-            },
-            Granularity="DAILY",
-            Metrics=["UnblendedCost"],
-            GroupBy=[
-                {"Type": "DIMENSION", "Key": "SERVICE"},
-            ],
-        )
+        while True:
+            response = cost_explorer.get_cost_and_usage(**request)
+            for result in response.get("ResultsByTime", []):
+                groups_by_date.setdefault(result["TimePeriod"]["Start"], []).extend(
+                    result.get("Groups", [])
+                )
+            next_page_token = response.get("NextPageToken")
+            if not next_page_token:
+                break
+            request["NextPageToken"] = next_page_token
     except Exception as e:
-        print(f"Error querying Cost Explorer: {e}")
+        logger.error("Error querying Cost Explorer: %s", e)
         return {
             "statusCode": 500,
             "body": {"error": str(e)},
         }
 
-    # Collect Anthropic historical costs if enabled
-    anthropic_daily_costs: dict[str, dict[str, float]] = {}
-    if config.collection.sources.anthropic.enabled:
-        anthropic_daily_costs = _backfill_anthropic_costs(config, start_date, end_date)
+    # Calculate TTL (90 days from now for backfilled data), shared by every
+    # snapshot in this run
+    ttl_days = 90 if config.environment != "dev" else 30
+    ttl = int((now + timedelta(days=ttl_days)).timestamp())
 
     # Process results and create snapshots
-    snapshots_created = 0
+    snapshots: list[CostSnapshot] = []
     snapshots_skipped = 0
 
-    for result in response.get("ResultsByTime", []):
-        period_start = result["TimePeriod"]["Start"]
+    # Check which dates already have data; the reads are independent, so
+    # issue them concurrently rather than one round trip per day. Each worker
+    # gets its own storage, since boto3 resources aren't thread-safe
+    period_starts = list(groups_by_date)
+    with ThreadPoolExecutor(
+        max_workers=10,
+        initializer=_init_backfill_worker,
+        initargs=(storage.table_name,),
+    ) as executor:
+        existing_by_date = dict(
+            zip(period_starts, executor.map(_count_snapshots_in_worker, period_starts))
+        )
+
+    # Collect Anthropic historical costs if enabled, only over the span of
+    # days still missing a snapshot so re-running a backfill doesn't walk
+    # the whole range again
+    anthropic_daily_costs: dict[str, dict[str, float]] = {}
+    missing_dates = [day for day in period_starts if not existing_by_date[day]]
+    if config.collection.sources.anthropic.enabled and missing_dates:
+        anthropic_daily_costs = _backfill_anthropic_costs(
+            config,
+            datetime.fromisoformat(min(missing_dates)).date(),
+            datetime.fromisoformat(max(missing_dates)).date() + timedelta(days=1),
+        )
 
+    for period_start, groups in groups_by_date.items():
         # Check if we already have data for this date
-        existing = storage.get_snapshots_for_date(period_start)
+        existing = existing_by_date[period_start]
         if existing:
-            print(f"  {period_start}: Already has {len(existing)} snapshot(s), skipping")
+            logger.info("  %s: Already has %s snapshot(s), skipping", period_start, existing)
             snapshots_skipped += 1
             continue
 
-        # Build cost by service dict from AWS
-        cost_by_service = {}
-        total_cost = 0.0
-
-        for group in result.get("Groups", []):
-            service_name = group["Keys"][0]
-            cost = float(group["Metrics"]["UnblendedCost"]["Amount"])
-            if cost > 0.001:  # Skip near-zero costs
-                cost_by_service[service_name] = cost
-                total_cost += cost
+        # Build cost by service dict from AWS, skipping near-zero costs
+        cost_by_service = {
+            group["Keys"][0]: cost
+            for group in groups
+            if (cost := float(group["Metrics"]["UnblendedCost"]["Amount"])) > 0.001
+        }
+        total_cost = sum(cost_by_service.values())
 
         # Merge Anthropic costs for this date if available
-        if period_start in anthropic_daily_costs:
-            anthropic_costs = anthropic_daily_costs[period_start]
-            for service_name, cost in anthropic_costs.items():
-                cost_by_service[service_name] = cost
-                total_cost += cost
+        anthropic_costs = anthropic_daily_costs.get(period_start, {})
+        cost_by_service.update(anthropic_costs)
+        claude_total = sum(anthropic_costs.values())
+        total_cost += claude_total
 
         if total_cost < 0.01:
-            print(f"  {period_start}: No significant costs, skipping")
+            logger.info("  %s: No significant costs, skipping", period_start)
             snapshots_skipped += 1
             continue
 
-        # Calculate TTL (90 days from now for backfilled data)
-        ttl_days = 90 if config.environment != "dev" else 30
-        ttl = int((datetime.now(UTC) + timedelta(days=ttl_days)).timestamp())
-
         # Create snapshot
         snapshot = CostSnapshot(
             timestamp=f"{period_start}T12:00:00Z",  # Noon UTC
@@ -791,15 +1148,25 @@ def _handle_backfill(
             ttl=ttl,
         )
 
-        storage.put_snapshot(snapshot)
-        snapshots_created += 1
+        snapshots.append(snapshot)
 
         # Show Claude costs separately in output if present
-        claude_total = sum(c for s, c in cost_by_service.items() if s.startswith("Claude::"))
         if claude_total > 0:
-            print(f"  {period_start}: ${total_cost:.2f} ({len(cost_by_service)} services, incl ${claude_total:.2f} Claude)")
+            logger.info(
+                "  %s: $%.2f (%s services, incl $%.2f Claude)",
+                period_start,
+                total_cost,
+                len(cost_by_service),
+                claude_total,
+            )
         else:
-            print(f"  {period_start}: ${total_cost:.2f} ({len(cost_by_service)} services)")
+            logger.info("  %s: $%.2f (%s services)", period_start, total_cost, len(cost_by_service))
+
+    # Write all new snapshots together; batch_writer chunks the requests and
+    # resubmits any unprocessed items
+    if snapshots:
+        storage.batch_put_snapshots(snapshots)
+    snapshots_created = len(snapshots)
 
     # Summary
     result = {
@@ -815,10 +1182,44 @@ def _handle_backfill(
         },
     }
 
-    print(f"\nBackfill completed: {json.dumps(result['body'], indent=2)}")
+    logger.info(
+        "Backfill completed: %s", json.dumps(result["body"], indent=2 if test_mode else None)
+    )
     return result
 
 
+def _init_backfill_worker(table_name: str) -> None:
+    """Give a backfill worker thread its own session, DynamoDB resource and storage."""
+    session = boto3.session.Session()
+    _backfill_worker.storage = DynamoDBStorage(
+        table_name, dynamodb_resource=session.resource("dynamodb")
+    )
+
+
+def _count_snapshots_in_worker(date: str) -> int:
+    """Count a date's snapshots using the current backfill worker's storage."""
+    return _backfill_worker.storage.count_snapshots_for_date(date)
+
+
+def _account_id_from_context(context: Any) -> str | None:
+    """
+    Extract the AWS account ID from a Lambda context's invoked function ARN.
+
+    Args:
+        context: Lambda context object, or None when invoked locally.
+
+    Returns:
+        The account ID, or None if the context has no usable ARN.
+    """
+    arn = getattr(context, "invoked_function_arn", None)
+    if not isinstance(arn, str):
+        return None
+    parts = arn.split(":")
+    if len(parts) < 5 or not parts[4].isdigit():
+        return None
+    return parts[4]
+
+
 def _backfill_anthropic_costs(
     config: Any,
     start_date: Any,
@@ -836,108 +1237,122 @@ def _backfill_anthropic_costs(
         Dict mapping date strings to cost_by_service dicts.
         Example: {"2025-01-15": {"Claude::Token Usage": 5.23}}
     """
-    from decimal import Decimal
-    import httpx
-
-    print(f"Querying Anthropic Cost API for {start_date} to {end_date}...")
+    logger.info("Querying Anthropic Cost API for %s to %s...", start_date, end_date)
 
     config_secret_name = os.environ.get("CONFIG_SECRET_NAME")
     if not config_secret_name:
-        print("Warning: CONFIG_SECRET_NAME not set, skipping Anthropic backfill")
+        logger.warning("CONFIG_SECRET_NAME not set, skipping Anthropic backfill")
         return {}
 
     try:
         # Get the admin API key from Secrets Manager
-        secrets_client = boto3.client("secretsmanager", region_name=config.aws.region)
-        secret_response = secrets_client.get_secret_value(SecretId=config_secret_name)
-        secrets = json.loads(secret_response["SecretString"])
+        secrets = _get_config_secrets(config_secret_name, config.aws.region)
 
         admin_api_key = secrets.get(config.collection.sources.anthropic.admin_api_key_secret_key)
         if not admin_api_key:
-            print("Warning: Anthropic admin API key not found, skipping backfill")
+            logger.warning("Anthropic admin API key not found, skipping backfill")
             return {}
 
-        # Query Anthropic Cost API with pagination support
-        base_params = {
-            "starting_at": f"{start_date.isoformat()}T00:00:00Z",
-            "ending_at": f"{end_date.isoformat()}T00:00:00Z",
-        }
-
-        headers = {
-            "anthropic-version": "2023-06-01",
-            "x-api-key": admin_api_key,
-        }
+        windows = []
+        window_start = start_date
+        while window_start < end_date:
+            window_end = min(
+                window_start + timedelta(days=_ANTHROPIC_BACKFILL_WINDOW_DAYS), end_date
+            )
+            windows.append((window_start, window_end))
+            window_start = window_end
 
         # Parse into daily costs by service
         daily_costs: dict[str, dict[str, float]] = {}
-
-        with httpx.Client(timeout=30.0) as client:
-            next_page = None
-            page_count = 0
-
-            while True:
-                page_count += 1
-                params = dict(base_params)
-                if next_page:
-                    params["page"] = next_page
-
-                response = client.get(
-                    "https://api.anthropic.com/v1/organizations/cost_report",
-                    params=params,
-                    headers=headers,
+        page_count = 0
+
+        client = _get_anthropic_http_client()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_ANTHROPIC_BACKFILL_MAX_WORKERS, len(windows)))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _fetch_anthropic_cost_window, client, admin_api_key, window_start, window_end
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                for bucket in data.get("data", []):
-                    # Field is "starting_at" not "bucket_start_time"
-                    bucket_date = bucket.get("starting_at", "")[:10]  # YYYY-MM-DD
-                    if not bucket_date:
-                        continue
-
-                    if bucket_date not in daily_costs:
-                        daily_costs[bucket_date] = {}
-
-                    for item in bucket.get("results", []):
-                        # Amount is in CENTS - convert to dollars
-                        cost_cents = float(Decimal(str(item.get("amount", "0"))))
-                        cost_dollars = cost_cents / 100
-
-                        if cost_dollars >= 0.005:
-                            # Use description, model, or fallback
-                            description = item.get("description") or item.get("model") or "API Usage"
-                            service_name = f"Claude::{description}"
-                            # Accumulate if same service
-                            if service_name in daily_costs[bucket_date]:
-                                daily_costs[bucket_date][service_name] += cost_dollars
-                            else:
-                                daily_costs[bucket_date][service_name] = cost_dollars
-
-                # Check for more pages
-                if data.get("has_more") and data.get("next_page"):
-                    next_page = data["next_page"]
-                else:
-                    break
-
-            if page_count > 1:
-                print(f"  Fetched {page_count} pages from Anthropic API")
+                for window_start, window_end in windows
+            ]
+            # Windows don't overlap, but accumulate in case a bucket repeats
+            for future in futures:
+                window_costs, window_pages = future.result()
+                page_count += window_pages
+                for bucket_date, services in window_costs.items():
+                    day_costs = daily_costs.setdefault(bucket_date, {})
+                    for service_name, cost in services.items():
+                        day_costs[service_name] = day_costs.get(service_name, 0.0) + cost
+
+        if page_count > 1:
+            logger.debug("  Fetched %s pages from Anthropic API", page_count)
 
         anthropic_total = sum(
             sum(services.values()) for services in daily_costs.values()
         )
-        print(f"Found Anthropic costs for {len(daily_costs)} days (${anthropic_total:.2f} total)")
+        logger.info(
+            "Found Anthropic costs for %s days ($%.2f total)",
+            len(daily_costs),
+            anthropic_total,
+        )
 
         return daily_costs
 
     except Exception as e:
-        print(f"Error backfilling Anthropic costs: {e}")
+        logger.error("Error backfilling Anthropic costs: %s", e)
         return {}
 
 
+def _fetch_anthropic_cost_window(
+    client: httpx.Client,
+    admin_api_key: str,
+    start_date: Any,
+    end_date: Any,
+) -> tuple[dict[str, dict[str, float]], int]:
+    """
+    Fetch every page of the Anthropic cost report for one date window.
+
+    Args:
+        client: httpx client to issue requests with.
+        admin_api_key: Anthropic Admin API key.
+        start_date: Start date of the window.
+        end_date: End date of the window (exclusive).
+
+    Returns:
+        Tuple of (date string -> cost_by_service dict, pages fetched).
+    """
+    daily_costs: dict[str, dict[str, float]] = {}
+    page_count = 0
+
+    for data in iter_cost_report_pages(client, admin_api_key, start_date, end_date):
+        page_count += 1
+        for bucket in data.get("data", []):
+            # Field is "starting_at" not "bucket_start_time"
+            bucket_date = bucket.get("starting_at", "")[:10]  # YYYY-MM-DD
+            if not bucket_date:
+                continue
+
+            day_costs = daily_costs.setdefault(bucket_date, {})
+
+            for item in bucket.get("results", []):
+                # Amount is in CENTS (a decimal string); skip anything under half a cent
+                cost_cents = float(item.get("amount") or 0)
+                if cost_cents >= 0.5:
+                    # Use description, model, or fallback
+                    description = item.get("description") or item.get("model") or "API Usage"
+                    service_name = f"Claude::{description}"
+                    # Accumulate if same service
+                    day_costs[service_name] = day_costs.get(service_name, 0.0) + cost_cents / 100
+
+    return daily_costs, page_count
+
+
 def _check_and_send_budget_alert(
     budget_info: BudgetStatus,
     config: Any,
     storage: DynamoDBStorage,
+    now: datetime,
     config_secret_name: str,
     llm_client: LLMClient | None,
     guardian_context: str,
@@ -953,6 +1368,7 @@ def _check_and_send_budget_alert(
         budget_info: Current budget status.
         config: Application configuration.
         storage: DynamoDB storage client.
+        now: Time of this run's snapshot.
         config_secret_name: Secrets Manager secret name.
         llm_client: Optional LLM client for AI recommendations.
         guardian_context: User context for AI.
@@ -976,75 +1392,40 @@ def _check_and_send_budget_alert(
         # No threshold crossed
         return None
 
-    print(f"Budget threshold crossed: {current_percent:.1f}% >= {threshold_value}% ({threshold_type})")
+    logger.info(
+        "Budget threshold crossed: %.1f%% >= %s%% (%s)",
+        current_percent,
+        threshold_value,
+        threshold_type,
+    )
 
-    # Check if we already sent an alert for this threshold today
-    today = datetime.now(UTC).date().isoformat()
-    today_snapshots = storage.get_snapshots_for_date(today)
+    # Check if we already sent an alert for this threshold today. Month-to-date
+    # spend only grows, so the latest earlier snapshot is enough; this run's
+    # own snapshot (stored under the current hour) is excluded
+    previous = storage.get_latest_snapshot_before(now.date().isoformat(), now.hour)
 
-    # Look for earlier snapshots that also exceeded this threshold
     already_alerted = False
-    for snapshot in today_snapshots:
-        if snapshot.budget_status:
-            prev_percent = snapshot.budget_status.monthly_percent
-            if threshold_type == "critical" and prev_percent >= critical_threshold:
-                already_alerted = True
-                break
-            elif threshold_type == "warning" and prev_percent >= warning_threshold:
-                # Only consider warning if we haven't crossed critical
-                if prev_percent < critical_threshold:
-                    already_alerted = True
-                    break
+    if previous and previous.budget_status:
+        prev_percent = previous.budget_status.monthly_percent
+        if threshold_type == "critical":
+            already_alerted = prev_percent >= critical_threshold
+        else:
+            # Only consider warning if we haven't crossed critical
+            already_alerted = warning_threshold <= prev_percent < critical_threshold
 
     if already_alerted:
-        print(f"Budget {threshold_type} alert already sent today, skipping")
+        logger.info("Budget %s alert already sent today, skipping", threshold_type)
         return None
 
-    # Generate AI recommendation if available
-    ai_recommendation = None
-    if llm_client:
-        try:
-            ai_recommendation = _generate_budget_recommendation(
-                budget_info=budget_info,
-                llm_client=llm_client,
-                guardian_context=guardian_context,
-            )
-            if ai_recommendation:
-                print("Generated AI recommendation for budget alert")
-        except Exception as e:
-            print(f"AI recommendation failed: {e}")
-
-    # Format and send the alert
-    try:
-        slack_formatter = SlackFormatter()
-        webhook_manager = SlackWebhookManager(
-            secret_name=config_secret_name,
-            region=config.aws.region,
-        )
-
-        message = slack_formatter.format_budget_alert(
-            budget_status=budget_info,
-            threshold_type=threshold_type,
-            ai_recommendation=ai_recommendation,
-        )
-
-        # Route to appropriate channel
-        channel_key = (
-            config.slack.channels["critical"].webhook_secret_key
-            if threshold_type == "critical"
-            else config.slack.channels["heartbeat"].webhook_secret_key
-        )
-
-        webhook_manager.send_to_channel(channel_key, message)
-        print(f"Sent budget {threshold_type} alert to Slack")
-        return threshold_type
-
-    except Exception as e:
-        print(f"Error sending budget alert: {e}")
-        if test_mode:
-            import traceback
-            traceback.print_exc()
-        return None
+    return _send_budget_alert_direct(
+        budget_info=budget_info,
+        threshold_type=threshold_type,
+        config=config,
+        config_secret_name=config_secret_name,
+        llm_client=llm_client,
+        guardian_context=guardian_context,
+        test_mode=test_mode,
+    )
 
 
 def _send_budget_alert_direct(
@@ -1059,7 +1440,8 @@ def _send_budget_alert_direct(
     """
     Send a budget alert directly without duplicate checking.
 
-    Used for testing with force_budget_alert.
+    Used by _check_and_send_budget_alert once a repeat alert has been ruled
+    out, and for testing with force_budget_alert.
     """
     # Generate AI recommendation if available
     ai_recommendation = None
@@ -1070,15 +1452,15 @@ def _send_budget_alert_direct(
                 llm_client=llm_client,
                 guardian_context=guardian_context,
             )
+            if ai_recommendation:
+                logger.info("Generated AI recommendation for budget alert")
         except Exception as e:
-            print(f"AI recommendation failed: {e}")
+            logger.warning("AI recommendation failed: %s", e)
 
+    # Format and send the alert
     try:
         slack_formatter = SlackFormatter()
-        webhook_manager = SlackWebhookManager(
-            secret_name=config_secret_name,
-            region=config.aws.region,
-        )
+        webhook_manager = _get_webhook_manager(config_secret_name, config.aws.region)
 
         message = slack_formatter.format_budget_alert(
             budget_status=budget_info,
@@ -1086,21 +1468,15 @@ def _send_budget_alert_direct(
             ai_recommendation=ai_recommendation,
         )
 
-        channel_key = (
-            config.slack.channels["critical"].webhook_secret_key
-            if threshold_type == "critical"
-            else config.slack.channels["heartbeat"].webhook_secret_key
-        )
+        # Route to appropriate channel
+        channel_key = _webhook_key_for_event(config, f"budget_{threshold_type}")
 
         webhook_manager.send_to_channel(channel_key, message)
-        print(f"Sent budget {threshold_type} alert to Slack")
+        logger.info("Sent budget %s alert to Slack", threshold_type)
         return threshold_type
 
     except Exception as e:
-        print(f"Error sending budget alert: {e}")
-        if test_mode:
-            import traceback
-            traceback.print_exc()
+        logger.error("Error sending budget alert: %s", e, exc_info=test_mode)
         return None
 
 
@@ -1141,10 +1517,40 @@ Focus on actionable steps. Do not repeat the numbers."""
         response = llm_client.chat(messages)
         return response.content
     except Exception as e:
-        print(f"Budget recommendation generation failed: {e}")
+        logger.warning("Budget recommendation generation failed: %s", e)
         return None
 
 
+def _collect_anthropic_costs_cached(config: Any, bypass_cache: bool = False) -> CostData | None:
+    """
+    Collect Anthropic costs, reusing a recent collection on warm invocations.
+
+    Args:
+        config: Application configuration.
+        bypass_cache: If True, always calls the Anthropic API.
+
+    Returns:
+        CostData with Anthropic costs, or None if collection fails.
+    """
+    global _anthropic_cache
+
+    ttl_seconds = config.collection.sources.anthropic.cache_ttl_seconds
+    now = time.monotonic()
+
+    if (
+        not bypass_cache
+        and _anthropic_cache is not None
+        and now - _anthropic_cache[0] < ttl_seconds
+    ):
+        logger.info("Using Anthropic costs collected %.0fs ago", now - _anthropic_cache[0])
+        return _anthropic_cache[1]
+
+    anthropic_data = _collect_anthropic_costs(config)
+    if anthropic_data is not None:
+        _anthropic_cache = (now, anthropic_data)
+    return anthropic_data
+
+
 def _collect_anthropic_costs(config: Any) -> CostData | None:
     """
     Collect costs from Anthropic API.
@@ -1157,20 +1563,18 @@ def _collect_anthropic_costs(config: Any) -> CostData | None:
     """
     config_secret_name = os.environ.get("CONFIG_SECRET_NAME")
     if not config_secret_name:
-        print("Warning: CONFIG_SECRET_NAME not set, cannot collect Anthropic costs")
+        logger.warning("CONFIG_SECRET_NAME not set, cannot collect Anthropic costs")
         return None
 
     try:
         # Get the admin API key from Secrets Manager
-        secrets_client = boto3.client("secretsmanager", region_name=config.aws.region)
-        secret_response = secrets_client.get_secret_value(SecretId=config_secret_name)
-        secrets = json.loads(secret_response["SecretString"])
+        secrets = _get_config_secrets(config_secret_name, config.aws.region)
 
         admin_api_key = secrets.get(config.collection.sources.anthropic.admin_api_key_secret_key)
         if not admin_api_key:
-            print(
-                f"Warning: Anthropic admin API key not found in secrets "
-                f"(key: {config.collection.sources.anthropic.admin_api_key_secret_key})"
+            logger.warning(
+                "Anthropic admin API key not found in secrets (key: %s)",
+                config.collection.sources.anthropic.admin_api_key_secret_key,
             )
             return None
 
@@ -1181,7 +1585,7 @@ def _collect_anthropic_costs(config: Any) -> CostData | None:
             )
 
     except Exception as e:
-        print(f"Error collecting Anthropic costs: {e}")
+        logger.error("Error collecting Anthropic costs: %s", e)
         return None
 
 
@@ -1202,31 +1606,21 @@ def _merge_provider_costs(
     Returns:
         Merged CostData with all provider costs.
     """
-    # Start with AWS data
-    merged_cost_by_service = dict(aws_data.cost_by_service)
-    total_cost = aws_data.total_cost
+    # Nothing to merge (Anthropic disabled or no spend): reuse the AWS data
+    if anthropic_data is None or anthropic_data.total_cost <= 0:
+        return aws_data
 
-    # Add Anthropic costs if available
-    if anthropic_data and anthropic_data.total_cost > 0:
-        total_cost += anthropic_data.total_cost
-        # Anthropic services are already prefixed with "Claude::" in the collector
-        merged_cost_by_service.update(anthropic_data.cost_by_service)
+    # Anthropic services are already prefixed with "Claude::" in the collector,
+    # but sum on a name collision rather than letting one provider's cost
+    # overwrite the other's
+    merged_cost_by_service = dict(aws_data.cost_by_service)
+    for service, cost in anthropic_data.cost_by_service.items():
+        merged_cost_by_service[service] = merged_cost_by_service.get(service, 0.0) + cost
 
-    # Create merged CostData
     # Note: We keep AWS's daily_costs for trend analysis since that's the primary cost driver
     # In the future, we could merge daily_costs from multiple providers
-    return CostData(
-        start_date=aws_data.start_date,
-        end_date=aws_data.end_date,
-        collection_timestamp=aws_data.collection_timestamp,
-        account_id=aws_data.account_id,
-        total_cost=round(total_cost, 2),
-        currency=aws_data.currency,
+    return replace(
+        aws_data,
+        total_cost=round(aws_data.total_cost + anthropic_data.total_cost, 2),
         cost_by_service=merged_cost_by_service,
-        cost_by_account=aws_data.cost_by_account,
-        daily_costs=aws_data.daily_costs,
-        budgets=aws_data.budgets,
-        forecast=aws_data.forecast,
-        trend=aws_data.trend,
-        average_daily_cost=aws_data.average_daily_cost,
     )
\ No newline at end of file
@@ -9,7 +9,7 @@ from botocore.exceptions import ClientError
 
 from slack_aws_cost_guardian.config.schema import LLMConfig
 from slack_aws_cost_guardian.llm.base import LLMMessage, LLMProvider, LLMResponse, LLMTool
-from slack_aws_cost_guardian.llm.providers import AnthropicProvider, OpenAIProvider
+from slack_aws_cost_guardian.llm import providers
 from slack_aws_cost_guardian.llm.tools.registry import ToolRegistry
 
 
@@ -80,9 +80,9 @@ class LLMClient:
             api_key = self._get_api_key()
 
             if self.config.provider == "anthropic":
-                self._provider = AnthropicProvider(api_key, self.config)
+                self._provider = providers.AnthropicProvider(api_key, self.config)
             elif self.config.provider == "openai":
-                self._provider = OpenAIProvider(api_key, self.config)
+                self._provider = providers.OpenAIProvider(api_key, self.config)
             else:
                 raise ValueError(f"Unknown provider: {self.config.provider}")
 
@@ -1,6 +1,28 @@
-"""LLM provider implementations."""
+"""LLM provider implementations.
 
-from slack_aws_cost_guardian.llm.providers.anthropic import AnthropicProvider
-from slack_aws_cost_guardian.llm.providers.openai import OpenAIProvider
+Providers are imported on first access so a deployment only loads the SDK
+(anthropic or openai) for the provider it is configured to use.
+"""
 
-__all__ = ["AnthropicProvider", "OpenAIProvider"]
\ No newline at end of file
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from slack_aws_cost_guardian.llm.providers.anthropic import AnthropicProvider
+    from slack_aws_cost_guardian.llm.providers.openai import OpenAIProvider
+
+_PROVIDER_MODULES = {
+    "AnthropicProvider": "slack_aws_cost_guardian.llm.providers.anthropic",
+    "OpenAIProvider": "slack_aws_cost_guardian.llm.providers.openai",
+}
+
+__all__ = ["AnthropicProvider", "OpenAIProvider"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a provider class on first access."""
+    if name in _PROVIDER_MODULES:
+        return getattr(import_module(_PROVIDER_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
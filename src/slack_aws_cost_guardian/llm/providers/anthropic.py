@@ -103,6 +103,21 @@ class AnthropicProvider(LLMProvider):
 
         return system_msg, api_messages
 
+    def _system_param(self, system_msg: str) -> str | list[dict[str, Any]]:
+        """
+        Build the system parameter, marking it for prompt caching.
+
+        The system prompt (and any tool definitions ahead of it) is the same
+        on every call, so Anthropic can reuse it from its prompt cache for a
+        few minutes instead of processing it again. Prompts shorter than the
+        model's minimum cacheable length are simply not cached.
+        """
+        if not system_msg:
+            return system_msg
+        return [
+            {"type": "text", "text": system_msg, "cache_control": {"type": "ephemeral"}}
+        ]
+
     def _convert_tools(self, tools: list[LLMTool]) -> list[dict[str, Any]]:
         """Convert LLMTool to Anthropic tool format."""
         return [
@@ -131,7 +146,7 @@ class AnthropicProvider(LLMProvider):
             model=self.model_id,
             max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
             temperature=kwargs.get("temperature", self.config.temperature),
-            system=system_msg,
+            system=self._system_param(system_msg),
             messages=user_messages,
         )
 
@@ -176,7 +191,7 @@ class AnthropicProvider(LLMProvider):
             model=self.model_id,
             max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
             temperature=kwargs.get("temperature", self.config.temperature),
-            system=system_msg,
+            system=self._system_param(system_msg),
             messages=user_messages,
             tools=api_tools,
         )
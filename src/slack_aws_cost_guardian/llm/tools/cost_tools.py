@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 from datetime import date, timedelta
 from typing import Any
 
@@ -245,11 +246,11 @@ def create_cost_tools(
                     snapshot = max(snapshots, key=lambda s: s.hour)
                     services = [
                         {"service": svc, "cost": cost}
-                        for svc, cost in sorted(
+                        for svc, cost in heapq.nlargest(
+                            limit,
                             snapshot.cost_by_service.items(),
                             key=lambda x: x[1],
-                            reverse=True,
-                        )[:limit]
+                        )
                     ]
 
                     return {
@@ -269,11 +270,11 @@ def create_cost_tools(
 
             services = [
                 {"service": svc, "cost": cost}
-                for svc, cost in sorted(
+                for svc, cost in heapq.nlargest(
+                    limit,
                     cost_data.cost_by_service.items(),
                     key=lambda x: x[1],
-                    reverse=True,
-                )[:limit]
+                )
             ]
 
             return {
@@ -1,6 +1,8 @@
 """Slack Block Kit message formatting."""
 
+import heapq
 import re
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -50,6 +52,18 @@ def _markdown_to_mrkdwn(text: str) -> str:
     return text
 
 
+def _split_provider_costs(service_costs: Iterable[tuple[str, float]]) -> dict[str, float]:
+    """Split (service, cost) pairs into AWS and Claude totals."""
+    aws_cost = 0.0
+    claude_cost = 0.0
+    for service, cost in service_costs:
+        if service.startswith("Claude::"):
+            claude_cost += cost
+        else:
+            aws_cost += cost
+    return {"aws": aws_cost, "claude": claude_cost}
+
+
 class SlackFormatter:
     """Format messages using Slack Block Kit."""
 
@@ -207,6 +221,100 @@ class SlackFormatter:
         Returns:
             Slack Block Kit message payload.
         """
+        return self._format_daily_report(
+            total_cost=cost_data.total_cost,
+            top_services=heapq.nlargest(
+                5, cost_data.cost_by_service.items(), key=lambda x: x[1]
+            ),
+            services_total=sum(cost_data.cost_by_service.values()),
+            provider_costs=(
+                provider_costs
+                if provider_costs is not None
+                else _split_provider_costs(cost_data.cost_by_service.items())
+            ),
+            trend=cost_data.trend,
+            average_daily_cost=cost_data.average_daily_cost,
+            forecasted_total=cost_data.forecast.forecasted_total if cost_data.forecast else None,
+            start_date=cost_data.start_date,
+            end_date=cost_data.end_date,
+            recent_daily_costs=[(dc.date, dc.cost) for dc in cost_data.daily_costs],
+            budget_status=budget_status,
+            ai_insight=ai_insight,
+            report_date=report_date,
+            cost_data_date=cost_data_date,
+            used_fallback=used_fallback,
+        )
+
+    def format_daily_report_from_summary(
+        self,
+        summary: dict[str, Any],
+        ai_insight: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Format a daily cost summary report from a build_daily_summary result.
+
+        Args:
+            summary: Daily summary dict from build_daily_summary.
+            ai_insight: Optional AI-generated insight.
+
+        Returns:
+            Slack Block Kit message payload.
+        """
+        top_services = [(s["service"], s["cost"]) for s in summary.get("top_services", [])]
+        report_date = summary.get("date", "")
+        provider_costs = summary.get("provider_costs")
+        if provider_costs is None:
+            provider_costs = _split_provider_costs(top_services)
+
+        budget_status = None
+        if summary.get("budget_monthly", 0) > 0:
+            budget_status = BudgetStatus(
+                monthly_budget=summary.get("budget_monthly", 0),
+                monthly_spent=summary.get("budget_spent", 0),
+                monthly_percent=summary.get("budget_percent", 0),
+            )
+
+        forecast = summary.get("forecast", 0)
+
+        return self._format_daily_report(
+            total_cost=summary.get("total_cost", 0),
+            top_services=top_services,
+            services_total=sum(cost for _, cost in top_services),
+            provider_costs=provider_costs,
+            trend=summary.get("trend", "unknown"),
+            average_daily_cost=summary.get("total_cost", 0),
+            forecasted_total=forecast if forecast > 0 else None,
+            start_date=report_date,
+            end_date=report_date,
+            recent_daily_costs=[
+                (dc["date"], dc["cost"]) for dc in summary.get("recent_daily_costs", [])
+            ],
+            budget_status=budget_status,
+            ai_insight=ai_insight,
+            report_date=summary.get("date"),
+            cost_data_date=summary.get("cost_data_date"),
+            used_fallback=summary.get("used_fallback", False),
+        )
+
+    def _format_daily_report(
+        self,
+        total_cost: float,
+        top_services: list[tuple[str, float]],
+        services_total: float,
+        provider_costs: dict[str, float],
+        trend: str,
+        average_daily_cost: float,
+        forecasted_total: float | None,
+        start_date: str,
+        end_date: str,
+        recent_daily_costs: list[tuple[str, float]],
+        budget_status: BudgetStatus | None,
+        ai_insight: str | None,
+        report_date: str | None,
+        cost_data_date: str | None,
+        used_fallback: bool,
+    ) -> dict[str, Any]:
+        """Build the daily report blocks shared by both daily report entry points."""
         # Use cost_data_date if provided (the actual date costs represent)
         # Fall back to report_date or today
         display_date = cost_data_date or report_date
@@ -219,20 +327,9 @@ class SlackFormatter:
         else:
             date_str = datetime.now(UTC).strftime("%B %d, %Y")
 
-        trend_emoji = self.TREND_EMOJI.get(cost_data.trend, "")
+        trend_emoji = self.TREND_EMOJI.get(trend, "")
         spend_label = "Today" if used_fallback else "Yesterday"
 
-        # Calculate provider costs if not provided
-        if provider_costs is None:
-            aws_cost = 0.0
-            claude_cost = 0.0
-            for service, cost in cost_data.cost_by_service.items():
-                if service.startswith("Claude::"):
-                    claude_cost += cost
-                else:
-                    aws_cost += cost
-            provider_costs = {"aws": aws_cost, "claude": claude_cost}
-
         aws_cost = provider_costs.get("aws", 0.0)
         claude_cost = provider_costs.get("claude", 0.0)
         has_claude = claude_cost > 0
@@ -274,16 +371,16 @@ class SlackFormatter:
                 f"({budget_status.monthly_percent:.0f}% of ${budget_status.monthly_budget:.0f} budget)"
             )
 
-        if cost_data.forecast:
+        if forecasted_total is not None:
             # Forecast is AWS-only (from AWS Cost Explorer API)
             forecast_pct = (
-                (cost_data.forecast.forecasted_total / budget_status.monthly_budget * 100)
+                (forecasted_total / budget_status.monthly_budget * 100)
                 if budget_status and budget_status.monthly_budget > 0
                 else 0
             )
             warning = " :warning:" if forecast_pct > 100 else ""
             aws_lines.append(
-                f"• Forecast: ${cost_data.forecast.forecasted_total:.2f} "
+                f"• Forecast: ${forecasted_total:.2f} "
                 f"({forecast_pct:.0f}% of budget){warning}"
             )
 
@@ -309,7 +406,7 @@ class SlackFormatter:
 
             # Combined Total section
             combined_lines = [f"*:moneybag: Combined Total*"]
-            combined_lines.append(f"• {spend_label}: ${cost_data.total_cost:.2f}")
+            combined_lines.append(f"• {spend_label}: ${total_cost:.2f}")
 
             blocks.append(
                 {
@@ -321,12 +418,8 @@ class SlackFormatter:
         blocks.append({"type": "divider"})
 
         # Top services
-        top_services = sorted(
-            cost_data.cost_by_service.items(), key=lambda x: x[1], reverse=True
-        )[:5]
-
         if top_services:
-            total = sum(cost_data.cost_by_service.values())
+            total = services_total
             service_lines = ["*Top 5 Services*:"]
             for i, (service, cost) in enumerate(top_services, 1):
                 pct = (cost / total * 100) if total > 0 else 0
@@ -345,7 +438,7 @@ class SlackFormatter:
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*Trend*: {trend_emoji} {cost_data.trend.title()} (avg ${cost_data.average_daily_cost:.2f}/day)",
+                    "text": f"*Trend*: {trend_emoji} {trend.title()} (avg ${average_daily_cost:.2f}/day)",
                 },
             }
         )
@@ -366,7 +459,7 @@ class SlackFormatter:
 
         # Footer with timestamp
         timestamp = _get_central_timestamp()
-        footer_text = f"Period: {cost_data.start_date} to {cost_data.end_date} | Generated {timestamp}"
+        footer_text = f"Period: {start_date} to {end_date} | Generated {timestamp}"
         blocks.append(
             {
                 "type": "context",
@@ -381,13 +474,13 @@ class SlackFormatter:
 
         # Show recent incomplete data (days after cost_data_date) if available
         # These are more recent days that may not be fully populated yet
-        if cost_data.daily_costs:
-            sorted_costs = sorted(cost_data.daily_costs, key=lambda x: x.date)
+        if recent_daily_costs:
+            sorted_costs = sorted(recent_daily_costs, key=lambda x: x[0])
 
             if sorted_costs:
                 recent_lines = []
-                for dc in sorted_costs:
-                    recent_lines.append(f"{dc.date}: ${dc.cost:.2f}")
+                for dc_date, dc_cost in sorted_costs:
+                    recent_lines.append(f"{dc_date}: ${dc_cost:.2f}")
 
                 blocks.append(
                     {
@@ -83,6 +83,45 @@ class DynamoDBStorage:
         )
         return [CostSnapshot.from_dynamodb_item(item) for item in response.get("Items", [])]
 
+    def count_snapshots_for_date(self, date: str) -> int:
+        """
+        Count the snapshots stored for a specific date.
+
+        Cheaper than get_snapshots_for_date when only existence matters: no
+        items are returned or parsed.
+
+        Args:
+            date: Date in YYYY-MM-DD format.
+
+        Returns:
+            Number of snapshots for the date.
+        """
+        response = self.table.query(
+            KeyConditionExpression=Key("PK").eq(f"SNAPSHOT#{date}"),
+            Select="COUNT",
+        )
+        return response.get("Count", 0)
+
+    def get_latest_snapshot_before(self, date: str, hour: int) -> CostSnapshot | None:
+        """
+        Get the latest snapshot on a date taken before the given hour.
+
+        Args:
+            date: Date in YYYY-MM-DD format.
+            hour: Hour (0-23); snapshots from this hour onwards are ignored.
+
+        Returns:
+            The latest earlier CostSnapshot that day, or None if there is none.
+        """
+        response = self.table.query(
+            KeyConditionExpression=Key("PK").eq(f"SNAPSHOT#{date}")
+            & Key("SK").lt(f"HOUR#{hour:02d}"),
+            ScanIndexForward=False,
+            Limit=1,
+        )
+        items = response.get("Items", [])
+        return CostSnapshot.from_dynamodb_item(items[0]) if items else None
+
     def get_recent_snapshots(
         self,
         days: int = 14,
@@ -0,0 +1,184 @@
+"""Tests for cost data collectors."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import httpx
+
+from slack_aws_cost_guardian.collectors.anthropic_costs import iter_cost_report_pages
+from slack_aws_cost_guardian.collectors.aws_budgets import BudgetsCollector
+from slack_aws_cost_guardian.collectors.aws_cost_explorer import CostExplorerCollector
+from slack_aws_cost_guardian.collectors.base import DailyCost
+
+
+class FakePaginator:
+    """Paginator stub that yields pre-built pages."""
+
+    def __init__(self, pages: list[dict]):
+        self.pages = pages
+        self.calls: list[dict] = []
+
+    def paginate(self, **kwargs):
+        self.calls.append(kwargs)
+        return iter(self.pages)
+
+
+class FakeBudgetsClient:
+    """Budgets client stub exposing only get_paginator."""
+
+    def __init__(self, pages: list[dict]):
+        self.paginator = FakePaginator(pages)
+
+    def get_paginator(self, operation_name: str) -> FakePaginator:
+        assert operation_name == "describe_budgets"
+        return self.paginator
+
+
+def make_budget(name: str, limit: str, actual: str, budget_type: str = "COST") -> dict:
+    """Helper to create a describe_budgets entry."""
+    return {
+        "BudgetName": name,
+        "BudgetType": budget_type,
+        "BudgetLimit": {"Amount": limit, "Unit": "USD"},
+        "CalculatedSpend": {
+            "ActualSpend": {"Amount": actual, "Unit": "USD"},
+            "ForecastedSpend": {"Amount": actual, "Unit": "USD"},
+        },
+    }
+
+
+class TestBudgetsCollector:
+    """Tests for BudgetsCollector."""
+
+    def test_collect_reads_all_pages(self):
+        """Test that budgets from every page are returned."""
+        client = FakeBudgetsClient(
+            [
+                {"Budgets": [make_budget("monthly", "100", "50")]},
+                {"Budgets": [make_budget("team", "200", "20")]},
+            ]
+        )
+        collector = BudgetsCollector(budgets_client=client)
+        collector._account_id = "123456789012"
+
+        budgets = collector.collect()
+
+        assert [b.name for b in budgets] == ["monthly", "team"]
+        assert budgets[0].percentage_used == 50.0
+        assert client.paginator.calls[0]["AccountId"] == "123456789012"
+
+    def test_collect_skips_non_cost_budgets(self):
+        """Test that usage budgets are ignored."""
+        client = FakeBudgetsClient(
+            [{"Budgets": [make_budget("usage", "10", "1", budget_type="USAGE")]}]
+        )
+        collector = BudgetsCollector(budgets_client=client)
+        collector._account_id = "123456789012"
+
+        assert collector.collect() == []
+
+
+class FakeCostExplorerClient:
+    """Cost Explorer client stub that records every request."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+
+    def get_cost_and_usage(self, **kwargs):
+        self.calls.append(("get_cost_and_usage", kwargs))
+        if kwargs.get("GroupBy"):
+            return {
+                "ResultsByTime": [
+                    {
+                        "TimePeriod": kwargs["TimePeriod"],
+                        "Groups": [
+                            {
+                                "Keys": ["Amazon EC2"],
+                                "Metrics": {"UnblendedCost": {"Amount": "12.5"}},
+                            }
+                        ],
+                    }
+                ]
+            }
+        return {
+            "ResultsByTime": [
+                {
+                    "TimePeriod": kwargs["TimePeriod"],
+                    "Total": {"UnblendedCost": {"Amount": "10.0"}},
+                }
+            ]
+        }
+
+    def get_cost_forecast(self, **kwargs):
+        self.calls.append(("get_cost_forecast", kwargs))
+        return {"Total": {"Amount": "100.0"}}
+
+
+class TestCostExplorerCollector:
+    """Tests for CostExplorerCollector."""
+
+    def make_collector(self, client: FakeCostExplorerClient) -> CostExplorerCollector:
+        collector = CostExplorerCollector(ce_client=client, cost_data_lag_days=2)
+        collector._account_id = "123456789012"
+        return collector
+
+    def test_collect_uses_single_today(self):
+        """Test that all date ranges derive from the same 'today'."""
+        client = FakeCostExplorerClient()
+        cost_data = self.make_collector(client).collect(lookback_days=7)
+
+        today = datetime.now(UTC).date()
+        assert cost_data.end_date == today.isoformat()
+        assert cost_data.start_date == (today - timedelta(days=7)).isoformat()
+        assert cost_data.cost_data_date == (today - timedelta(days=2)).isoformat()
+        assert cost_data.cost_by_service == {"Amazon EC2": 12.5}
+        assert cost_data.total_cost == 12.5
+
+    def test_collect_reuses_daily_query_for_month_to_date(self):
+        """Test that month-to-date spend doesn't need its own query."""
+        client = FakeCostExplorerClient()
+        cost_data = self.make_collector(client).collect(lookback_days=7)
+
+        today = datetime.now(UTC).date()
+        usage_calls = [kw for name, kw in client.calls if name == "get_cost_and_usage"]
+        # daily totals, cost by service, cost by account
+        assert len(usage_calls) == 3
+        (daily_call,) = [kw for kw in usage_calls if "GroupBy" not in kw]
+        daily_start = daily_call["TimePeriod"]["Start"]
+        assert daily_start == min(today - timedelta(days=7), today.replace(day=1)).isoformat()
+        # Trend data is still limited to the lookback window
+        assert all(dc.date >= cost_data.start_date for dc in cost_data.daily_costs)
+
+    def test_calculate_trend(self):
+        """Test trend classification from daily costs."""
+        collector = self.make_collector(FakeCostExplorerClient())
+        rising = [DailyCost(date=f"2025-01-0{i}", cost=c) for i, c in enumerate([1, 1, 2, 2], 1)]
+        flat = [DailyCost(date=f"2025-01-0{i}", cost=5.0) for i in range(1, 5)]
+
+        assert collector._calculate_trend(rising) == "increasing"
+        assert collector._calculate_trend(list(reversed(rising))) == "decreasing"
+        assert collector._calculate_trend(flat) == "stable"
+        assert collector._calculate_trend(flat[:1]) == "unknown"
+
+
+class TestCostReportPages:
+    """Tests for Anthropic cost report pagination."""
+
+    def test_follows_next_page_cursor(self):
+        """Test that pages are fetched until has_more is false."""
+        requests: list[httpx.Request] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if "page" not in request.url.params:
+                return httpx.Response(200, json={"data": [1], "has_more": True, "next_page": "p2"})
+            return httpx.Response(200, json={"data": [2], "has_more": False, "next_page": None})
+
+        client = httpx.Client(transport=httpx.MockTransport(respond))
+        pages = list(
+            iter_cost_report_pages(client, "sk-ant-admin-test", date(2025, 1, 1), date(2025, 1, 8))
+        )
+
+        assert [page["data"] for page in pages] == [[1], [2]]
+        assert requests[1].url.params["page"] == "p2"
+        assert requests[0].url.params["starting_at"] == "2025-01-01T00:00:00Z"
+        assert requests[0].headers["x-api-key"] == "sk-ant-admin-test"
@@ -1,6 +1,16 @@
 """Tests for configuration module."""
 
+import io
+
 import pytest
+from botocore.response import StreamingBody
+
+from slack_aws_cost_guardian.config.loader import (
+    _apply_env_overrides,
+    _guardian_context_cache,
+    get_cached_guardian_context,
+    load_guardian_context,
+)
 from slack_aws_cost_guardian.config.schema import (
     Config,
     AnomalyDetectionConfig,
@@ -37,8 +47,29 @@ class TestConfig:
         """Test Slack config default values."""
         config = SlackConfig()
         assert config.enabled is True
-        assert "critical" in config.channels
-        assert "heartbeat" in config.channels
+        assert config.channels.critical.webhook_secret_key == "webhook_url_critical"
+        assert config.channels.heartbeat.webhook_secret_key == "webhook_url_heartbeat"
+
+    def test_slack_channels_from_dict(self, sample_config_dict):
+        """Test that YAML-style channel mappings load into the fixed model."""
+        config = Config(**sample_config_dict)
+        assert config.slack.channels.critical.name == "#alerts-critical"
+        assert config.slack.channels.heartbeat.name == "#alerts-general"
+
+    def test_partial_provider_block_keeps_default_model(self):
+        """Test that a provider block without model_id uses that provider's default."""
+        config = Config.model_validate({"llm": {"openai": {}, "anthropic": {}}})
+        assert config.llm.openai.model_id == "gpt-4o"
+        assert config.llm.anthropic.model_id == "claude-sonnet-4-20250514"
+
+    def test_routing_route(self):
+        """Test event routing lookups honour overrides."""
+        config = Config(routing={"budget_warning": "critical"})
+        assert config.routing.route("budget_warning") == "critical"
+        assert config.routing.route("daily_report") == "heartbeat"
+        assert config.slack.channels.webhook_secret_key_for_channel("critical") == (
+            "webhook_url_critical"
+        )
 
 
 class TestConfigValidation:
@@ -54,4 +85,68 @@ class TestConfigValidation:
         with pytest.raises(ValueError):
             AnomalyDetectionConfig(
                 thresholds={"absolute": -100, "percent_change": 50, "std_deviations": 2.5}
-            )
\ No newline at end of file
+            )
+
+    def test_unknown_key_rejected(self, sample_config_dict):
+        """Test that misspelled config keys fail validation."""
+        sample_config_dict["anomaly_detection"]["baseline_dayz"] = 7
+        with pytest.raises(ValueError):
+            Config(**sample_config_dict)
+
+    def test_config_is_frozen(self):
+        """Test that loaded config cannot be mutated."""
+        config = Config()
+        with pytest.raises(ValueError):
+            config.anomaly_detection.baseline_days = 7
+
+
+class TestLoadGuardianContext:
+    """Tests for load_guardian_context."""
+
+    def test_decodes_streamed_body(self):
+        """Test that multi-byte characters split across chunks decode correctly."""
+        raw = ("# Context\n" + "é" * 50_000).encode("utf-8")
+
+        class FakeS3:
+            def get_object(self, Bucket, Key):
+                return {"Body": StreamingBody(io.BytesIO(raw), len(raw))}
+
+        assert load_guardian_context("bucket", s3_client=FakeS3()) == raw.decode("utf-8")
+
+    def test_cached_context_reused_within_ttl(self):
+        """Test that warm invocations don't re-fetch the context."""
+        calls = []
+
+        class FakeS3:
+            def get_object(self, Bucket, Key):
+                calls.append(Key)
+                return {"Body": StreamingBody(io.BytesIO(b"ctx"), 3)}
+
+        _guardian_context_cache.clear()
+        s3 = FakeS3()
+
+        assert get_cached_guardian_context("bucket", s3_client=s3) == "ctx"
+        assert get_cached_guardian_context("bucket", s3_client=s3) == "ctx"
+        assert len(calls) == 1
+
+        assert get_cached_guardian_context("bucket", s3_client=s3, ttl_seconds=0) == "ctx"
+        assert len(calls) == 2
+        _guardian_context_cache.clear()
+
+
+class TestEnvOverrides:
+    """Tests for environment variable overrides."""
+
+    def test_env_overrides_applied(self, monkeypatch):
+        """Test that mapped environment variables override config values."""
+        monkeypatch.setenv("MONTHLY_BUDGET", "250")
+        monkeypatch.setenv("SLACK_ENABLED", "false")
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        monkeypatch.delenv("LLM_PROVIDER", raising=False)
+
+        data = _apply_env_overrides({"aws": {"region": "us-east-1"}})
+
+        assert data["budgets"]["monthly"]["amount"] == 250.0
+        assert data["slack"]["enabled"] is False
+        assert data["aws"]["region"] == "eu-west-1"
+        assert "llm" not in data
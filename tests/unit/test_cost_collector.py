@@ -0,0 +1,395 @@
+"""Tests for the cost collector Lambda handler."""
+
+import json
+import threading
+import time
+from datetime import UTC, date, datetime, timedelta
+
+import httpx
+import pytest
+
+from slack_aws_cost_guardian.analysis.anomaly_detector import DetectedAnomaly
+from slack_aws_cost_guardian.config import Config, LLMConfig
+from slack_aws_cost_guardian.handlers import cost_collector
+from slack_aws_cost_guardian.handlers.cost_collector import _resolve_log_level
+from slack_aws_cost_guardian.notifications.slack.formatter import SlackFormatter
+from slack_aws_cost_guardian.notifications.slack.webhook import SlackWebhookError
+from slack_aws_cost_guardian.storage.models import BudgetStatus, CostSnapshot
+
+
+class TestResolveLogLevel:
+    """Tests for _resolve_log_level."""
+
+    def test_maps_lambda_only_levels(self):
+        """Test that Lambda level names logging doesn't know are translated."""
+        assert _resolve_log_level("TRACE") == "DEBUG"
+        assert _resolve_log_level("WARN") == "WARNING"
+        assert _resolve_log_level("FATAL") == "CRITICAL"
+
+    def test_defaults_to_info(self):
+        """Test that unset or unknown levels fall back to INFO."""
+        assert _resolve_log_level(None) == "INFO"
+        assert _resolve_log_level("VERBOSE") == "INFO"
+        assert _resolve_log_level("error") == "ERROR"
+
+
+class TestSecretHoldingClientCache:
+    """Tests for the TTL caches of clients that hold a secret."""
+
+    def test_webhook_manager_rebuilt_after_ttl(self, monkeypatch):
+        """Test that a warm container re-reads rotated webhooks once the TTL passes."""
+        monkeypatch.setattr(cost_collector, "SlackWebhookManager", lambda **kwargs: object())
+        monkeypatch.setattr(cost_collector, "_get_secrets_client", lambda region: None)
+        monkeypatch.setattr(cost_collector, "_webhook_manager_cache", {})
+
+        first = cost_collector._get_webhook_manager("secret", "us-east-1")
+        assert cost_collector._get_webhook_manager("secret", "us-east-1") is first
+
+        monkeypatch.setattr(cost_collector, "_SECRETS_CACHE_TTL_SECONDS", 0.0)
+        assert cost_collector._get_webhook_manager("secret", "us-east-1") is not first
+
+    def test_llm_client_rebuilt_after_ttl(self, monkeypatch):
+        """Test that a warm container picks up a rotated LLM key once the TTL passes."""
+        monkeypatch.setattr(cost_collector, "LLMClient", lambda **kwargs: object())
+        monkeypatch.setattr(cost_collector, "_llm_client_cache", {})
+        llm_config = LLMConfig()
+
+        first = cost_collector._get_llm_client(llm_config, "secret", "us-east-1")
+        assert cost_collector._get_llm_client(llm_config, "secret", "us-east-1") is first
+
+        monkeypatch.setattr(cost_collector, "_SECRETS_CACHE_TTL_SECONDS", 0.0)
+        assert cost_collector._get_llm_client(llm_config, "secret", "us-east-1") is not first
+
+
+class FakeSnapshotStorage:
+    """Storage stub returning a fixed earlier snapshot."""
+
+    def __init__(self, previous: CostSnapshot | None):
+        self.previous = previous
+        self.calls: list[tuple[str, int]] = []
+
+    def get_latest_snapshot_before(self, date: str, hour: int) -> CostSnapshot | None:
+        self.calls.append((date, hour))
+        return self.previous
+
+
+def make_budget_status(percent: float) -> BudgetStatus:
+    """Helper to create a budget status at a given percentage used."""
+    return BudgetStatus(monthly_budget=100.0, monthly_spent=percent, monthly_percent=percent)
+
+
+class TestCheckAndSendBudgetAlert:
+    """Tests for budget alert deduplication."""
+
+    now = datetime(2025, 1, 10, 14, 5, tzinfo=UTC)
+
+    def check(self, monkeypatch, current: float, previous: float | None) -> tuple:
+        sent: list[str] = []
+
+        def fake_send(budget_info, threshold_type, **kwargs):
+            sent.append(threshold_type)
+            return threshold_type
+
+        monkeypatch.setattr(cost_collector, "_send_budget_alert_direct", fake_send)
+        snapshot = None
+        if previous is not None:
+            snapshot = CostSnapshot(
+                account_id="123456789012",
+                date="2025-01-10",
+                hour=8,
+                total_cost=previous,
+                budget_status=make_budget_status(previous),
+            )
+        storage = FakeSnapshotStorage(snapshot)
+
+        result = cost_collector._check_and_send_budget_alert(
+            budget_info=make_budget_status(current),
+            config=Config(),
+            storage=storage,
+            now=self.now,
+            config_secret_name="secret",
+            llm_client=None,
+            guardian_context="",
+            test_mode=False,
+        )
+        return result, sent, storage.calls
+
+    def test_sends_without_earlier_snapshot(self, monkeypatch):
+        """Test that the first run crossing a threshold today alerts."""
+        result, sent, calls = self.check(monkeypatch, current=85.0, previous=None)
+        assert result == "warning"
+        assert sent == ["warning"]
+        # This run's own snapshot (hour 14) must not count as a previous alert
+        assert calls == [("2025-01-10", 14)]
+
+    def test_warning_suppressed_when_already_in_band(self, monkeypatch):
+        """Test that a warning isn't repeated once an earlier run was in the band."""
+        result, sent, _ = self.check(monkeypatch, current=90.0, previous=85.0)
+        assert result is None
+        assert sent == []
+
+    def test_critical_sent_after_warning(self, monkeypatch):
+        """Test that rising from warning to critical still alerts."""
+        result, sent, _ = self.check(monkeypatch, current=105.0, previous=85.0)
+        assert result == "critical"
+        assert sent == ["critical"]
+
+    def test_below_thresholds_skips_lookup(self, monkeypatch):
+        """Test that no storage read happens when no threshold is crossed."""
+        result, sent, calls = self.check(monkeypatch, current=50.0, previous=None)
+        assert result is None
+        assert sent == [] and calls == []
+
+
+class FakeLLMClient:
+    """LLM client stub that records which services were analyzed."""
+
+    def __init__(self):
+        self.analyzed: list[str] = []
+
+    def analyze_anomaly(self, anomaly_data, historical_context, user_context, system_prompt):
+        self.analyzed.append(anomaly_data["service"])
+        return f"Analysis of {anomaly_data['service']}"
+
+
+class FakeWebhookManager:
+    """Webhook manager stub that records sends and fails for chosen services."""
+
+    def __init__(self, failing: frozenset[str] = frozenset()):
+        self.failing = failing
+        self.sent: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def send_to_channel(self, channel_key: str, message: dict) -> None:
+        text = json.dumps(message)
+        if any(service in text for service in self.failing):
+            raise SlackWebhookError("webhook rejected")
+        with self._lock:
+            self.sent.append((channel_key, text))
+
+
+def make_anomaly(service: str, severity: str = "warning", percent: float = 75.0) -> DetectedAnomaly:
+    """Helper to create a detected anomaly."""
+    return DetectedAnomaly(
+        service=service,
+        current_cost=175.0,
+        baseline_cost=100.0,
+        absolute_change=75.0,
+        percent_change=percent,
+        std_deviations=3.0,
+        severity=severity,
+        reason="test",
+    )
+
+
+class TestSendAnomalyAlerts:
+    """Tests for the per-anomaly alert fan-out."""
+
+    def send(
+        self,
+        monkeypatch,
+        anomalies,
+        llm_client=None,
+        webhook_manager=None,
+        test_mode=False,
+        config=None,
+    ):
+        webhook_manager = webhook_manager or FakeWebhookManager()
+        monkeypatch.setattr(
+            cost_collector, "_get_webhook_manager", lambda secret_name, region: webhook_manager
+        )
+        sent = cost_collector._send_anomaly_alerts(
+            anomalies=anomalies,
+            historical=[],
+            config=config or Config(),
+            config_secret_name="secret",
+            llm_client=llm_client,
+            guardian_context="",
+            slack_formatter=SlackFormatter(),
+            test_mode=test_mode,
+        )
+        return sent, webhook_manager
+
+    @pytest.fixture(autouse=True)
+    def empty_analysis_cache(self, monkeypatch):
+        """Start every test without cached analyses."""
+        monkeypatch.setattr(cost_collector, "_analysis_cache", {})
+
+    def test_routes_each_anomaly_by_severity(self, monkeypatch):
+        """Test that every anomaly is sent, critical ones to the critical channel."""
+        anomalies = [
+            make_anomaly("Amazon EC2", "critical"),
+            make_anomaly("Amazon S3", "warning"),
+            make_anomaly("AWS Lambda", "info"),
+        ]
+        sent, webhooks = self.send(monkeypatch, anomalies)
+
+        assert sent == 3
+        channels = sorted(channel for channel, _ in webhooks.sent)
+        assert channels == [
+            "webhook_url_critical",
+            "webhook_url_heartbeat",
+            "webhook_url_heartbeat",
+        ]
+
+    def test_routing_overrides_channel(self, monkeypatch):
+        """Test that config.routing decides where anomaly alerts go."""
+        _, webhooks = self.send(
+            monkeypatch,
+            [make_anomaly("Amazon EC2", "warning")],
+            config=Config(routing={"anomaly_warning": "critical"}),
+        )
+
+        assert [channel for channel, _ in webhooks.sent] == ["webhook_url_critical"]
+
+    def test_failed_send_not_counted(self, monkeypatch):
+        """Test that one failing alert doesn't stop or inflate the others."""
+        anomalies = [make_anomaly("Amazon EC2"), make_anomaly("Amazon S3")]
+        sent, webhooks = self.send(
+            monkeypatch, anomalies, webhook_manager=FakeWebhookManager(failing={"Amazon S3"})
+        )
+
+        assert sent == 1
+        assert len(webhooks.sent) == 1
+        assert "Amazon EC2" in webhooks.sent[0][1]
+
+    def test_analysis_limited_by_min_severity(self, monkeypatch):
+        """Test that anomalies below llm.min_severity skip the LLM."""
+        llm_client = FakeLLMClient()
+        anomalies = [make_anomaly("Amazon EC2", "warning"), make_anomaly("Amazon S3", "info")]
+
+        sent, _ = self.send(monkeypatch, anomalies, llm_client=llm_client)
+
+        assert sent == 2
+        assert llm_client.analyzed == ["Amazon EC2"]
+
+    def test_similar_anomaly_reuses_analysis(self, monkeypatch):
+        """Test that a near-duplicate anomaly hits the analysis cache."""
+        llm_client = FakeLLMClient()
+
+        self.send(monkeypatch, [make_anomaly("Amazon EC2", percent=72.0)], llm_client=llm_client)
+        _, webhooks = self.send(
+            monkeypatch, [make_anomaly("Amazon EC2", percent=68.0)], llm_client=llm_client
+        )
+
+        assert llm_client.analyzed == ["Amazon EC2"]
+        assert "Analysis of Amazon EC2" in webhooks.sent[0][1]
+
+    def test_different_change_misses_cache(self, monkeypatch):
+        """Test that a materially different change is analyzed again."""
+        llm_client = FakeLLMClient()
+
+        self.send(monkeypatch, [make_anomaly("Amazon EC2", percent=70.0)], llm_client=llm_client)
+        self.send(monkeypatch, [make_anomaly("Amazon EC2", percent=150.0)], llm_client=llm_client)
+
+        assert llm_client.analyzed == ["Amazon EC2", "Amazon EC2"]
+
+    def test_test_mode_bypasses_cache(self, monkeypatch):
+        """Test that test mode always calls the LLM."""
+        llm_client = FakeLLMClient()
+        anomaly = make_anomaly("Amazon EC2")
+
+        self.send(monkeypatch, [anomaly], llm_client=llm_client)
+        self.send(monkeypatch, [anomaly], llm_client=llm_client, test_mode=True)
+
+        assert llm_client.analyzed == ["Amazon EC2", "Amazon EC2"]
+
+
+class TestBackfillAnthropicCosts:
+    """Tests for the windowed Anthropic cost backfill."""
+
+    def backfill(self, monkeypatch, respond, start: date, end: date) -> dict:
+        monkeypatch.setenv("CONFIG_SECRET_NAME", "secret")
+        monkeypatch.setattr(
+            cost_collector,
+            "_get_config_secrets",
+            lambda secret_name, region: {"anthropic_admin_api_key": "sk-ant-admin-test"},
+        )
+        client = httpx.Client(transport=httpx.MockTransport(respond))
+        monkeypatch.setattr(cost_collector, "_get_anthropic_http_client", lambda: client)
+        return cost_collector._backfill_anthropic_costs(Config(), start, end)
+
+    def test_splits_range_into_weekly_windows(self, monkeypatch):
+        """Test that windows cover the range exactly and their buckets are merged."""
+        windows: list[tuple[str, str]] = []
+        lock = threading.Lock()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            starting_at = request.url.params["starting_at"]
+            ending_at = request.url.params["ending_at"]
+            with lock:
+                windows.append((starting_at[:10], ending_at[:10]))
+            window_start = date.fromisoformat(starting_at[:10])
+            window_end = date.fromisoformat(ending_at[:10])
+            buckets = [
+                {
+                    "starting_at": f"{day.isoformat()}T00:00:00Z",
+                    "results": [{"amount": "150", "description": "Token Usage"}],
+                }
+                for day in (
+                    window_start + timedelta(days=i)
+                    for i in range((window_end - window_start).days)
+                )
+            ]
+            if window_start == date(2025, 1, 8):
+                # A bucket repeated from the previous window accumulates
+                buckets.append(
+                    {
+                        "starting_at": "2025-01-07T00:00:00Z",
+                        "results": [{"amount": "25", "description": "Token Usage"}],
+                    }
+                )
+            return httpx.Response(200, json={"data": buckets, "has_more": False})
+
+        daily_costs = self.backfill(monkeypatch, respond, date(2025, 1, 1), date(2025, 1, 17))
+
+        assert sorted(windows) == [
+            ("2025-01-01", "2025-01-08"),
+            ("2025-01-08", "2025-01-15"),
+            ("2025-01-15", "2025-01-17"),
+        ]
+        assert len(daily_costs) == 16
+        assert daily_costs["2025-01-01"] == {"Claude::Token Usage": 1.5}
+        assert daily_costs["2025-01-16"] == {"Claude::Token Usage": 1.5}
+        assert daily_costs["2025-01-07"] == {"Claude::Token Usage": 1.75}
+
+    def test_failed_window_returns_nothing(self, monkeypatch):
+        """Test that a partial backfill isn't returned when any window fails."""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if request.url.params["starting_at"].startswith("2025-01-08"):
+                return httpx.Response(500, json={"error": "unavailable"})
+            bucket = {
+                "starting_at": request.url.params["starting_at"],
+                "results": [{"amount": "150", "description": "Token Usage"}],
+            }
+            return httpx.Response(200, json={"data": [bucket], "has_more": False})
+
+        assert self.backfill(monkeypatch, respond, date(2025, 1, 1), date(2025, 1, 17)) == {}
+
+
+class TestCacheAnalysis:
+    """Tests for the bounded AI analysis cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_analysis_cache(self, monkeypatch):
+        """Start every test without cached analyses."""
+        monkeypatch.setattr(cost_collector, "_analysis_cache", {})
+
+    def test_expired_entries_dropped_on_insert(self, monkeypatch):
+        """Test that stale analyses don't accumulate in a warm container."""
+        stale_at = time.monotonic() - cost_collector._ANALYSIS_CACHE_TTL_SECONDS - 1
+        cost_collector._analysis_cache[("Amazon S3", 50.0, "warning")] = (stale_at, "old")
+
+        cost_collector._cache_analysis(("Amazon EC2", 70.0, "warning"), "new")
+
+        assert list(cost_collector._analysis_cache) == [("Amazon EC2", 70.0, "warning")]
+
+    def test_oldest_evicted_beyond_cap(self, monkeypatch):
+        """Test that the cache never grows past its maximum size."""
+        monkeypatch.setattr(cost_collector, "_ANALYSIS_CACHE_MAX_ENTRIES", 2)
+
+        for service in ("Amazon EC2", "Amazon S3", "AWS Lambda"):
+            cost_collector._cache_analysis((service, 70.0, "warning"), service)
+
+        assert [key[0] for key in cost_collector._analysis_cache] == ["Amazon S3", "AWS Lambda"]
@@ -0,0 +1,81 @@
+"""Tests for Slack message formatting."""
+
+from slack_aws_cost_guardian.collectors.base import CostData, DailyCost, ForecastInfo
+from slack_aws_cost_guardian.notifications.slack.formatter import SlackFormatter
+from slack_aws_cost_guardian.storage.models import BudgetStatus
+
+
+def block_texts(message: dict) -> str:
+    """Helper to flatten all text in a Block Kit message."""
+    texts = []
+    for block in message["blocks"]:
+        if "text" in block:
+            texts.append(block["text"]["text"])
+        for element in block.get("elements", []):
+            texts.append(element["text"])
+    return "\n".join(texts)
+
+
+class TestDailyReport:
+    """Tests for the daily report formatters."""
+
+    def test_from_summary_matches_cost_data_report(self, monkeypatch):
+        """Test that the summary and CostData entry points render the same report."""
+        monkeypatch.setattr(
+            "slack_aws_cost_guardian.notifications.slack.formatter._get_central_timestamp",
+            lambda: "now",
+        )
+        summary = {
+            "date": "2025-01-15",
+            "cost_data_date": "2025-01-14",
+            "total_cost": 70.0,
+            "top_services": [
+                {"service": "Amazon EC2", "cost": 50.0},
+                {"service": "Claude::Token Usage", "cost": 20.0},
+            ],
+            "trend": "increasing",
+            "budget_percent": 40.0,
+            "budget_monthly": 1000.0,
+            "budget_spent": 400.0,
+            "forecast": 1200.0,
+            "recent_daily_costs": [{"date": "2025-01-16", "cost": 3.0}],
+            "has_data": True,
+            "used_fallback": False,
+        }
+        cost_data = CostData(
+            start_date="2025-01-15",
+            end_date="2025-01-15",
+            collection_timestamp="",
+            account_id="",
+            total_cost=70.0,
+            cost_by_service={"Amazon EC2": 50.0, "Claude::Token Usage": 20.0},
+            daily_costs=[DailyCost(date="2025-01-16", cost=3.0)],
+            trend="increasing",
+            average_daily_cost=70.0,
+            forecast=ForecastInfo(
+                forecasted_total=1200.0,
+                current_spend=400.0,
+                days_remaining=0,
+                daily_average=0,
+                month="",
+            ),
+        )
+        budget_status = BudgetStatus(
+            monthly_budget=1000.0, monthly_spent=400.0, monthly_percent=40.0
+        )
+        formatter = SlackFormatter()
+
+        from_summary = formatter.format_daily_report_from_summary(summary, ai_insight="Tip")
+        from_cost_data = formatter.format_daily_report(
+            cost_data=cost_data,
+            budget_status=budget_status,
+            ai_insight="Tip",
+            report_date="2025-01-15",
+            cost_data_date="2025-01-14",
+        )
+
+        assert from_summary == from_cost_data
+        text = block_texts(from_summary)
+        assert "January 14, 2025" in text
+        assert "Claude API Costs" in text
+        assert "Forecast: $1200.00 (120% of budget) :warning:" in text
@@ -0,0 +1,86 @@
+"""Tests for DynamoDB storage."""
+
+from boto3.dynamodb.conditions import Key
+
+from slack_aws_cost_guardian.storage.dynamodb import DynamoDBStorage
+from slack_aws_cost_guardian.storage.models import BudgetStatus, CostSnapshot
+
+
+class FakeTable:
+    """DynamoDB Table stub that records queries and returns a canned response."""
+
+    def __init__(self, response: dict):
+        self.response = response
+        self.queries: list[dict] = []
+
+    def query(self, **kwargs):
+        self.queries.append(kwargs)
+        return self.response
+
+
+class FakeDynamoDBResource:
+    """DynamoDB resource stub handing out a single FakeTable."""
+
+    def __init__(self, table: FakeTable):
+        self.table = table
+
+    def Table(self, name: str) -> FakeTable:
+        return self.table
+
+
+def make_storage(response: dict) -> tuple[DynamoDBStorage, FakeTable]:
+    """Helper to create storage backed by a FakeTable."""
+    table = FakeTable(response)
+    return DynamoDBStorage("test-table", dynamodb_resource=FakeDynamoDBResource(table)), table
+
+
+class TestGetLatestSnapshotBefore:
+    """Tests for DynamoDBStorage.get_latest_snapshot_before."""
+
+    def test_queries_newest_earlier_hour(self):
+        """Test that only the latest snapshot before the hour is requested."""
+        previous = CostSnapshot(
+            account_id="123456789012",
+            date="2025-01-10",
+            hour=8,
+            total_cost=50.0,
+            budget_status=BudgetStatus(
+                monthly_budget=100.0, monthly_spent=85.0, monthly_percent=85.0
+            ),
+        )
+        storage, table = make_storage({"Items": [previous.to_dynamodb_item()]})
+
+        snapshot = storage.get_latest_snapshot_before("2025-01-10", 14)
+
+        (query,) = table.queries
+        assert query["KeyConditionExpression"] == (
+            Key("PK").eq("SNAPSHOT#2025-01-10") & Key("SK").lt("HOUR#14")
+        )
+        assert query["ScanIndexForward"] is False
+        assert query["Limit"] == 1
+        assert snapshot.hour == 8
+        assert snapshot.budget_status.monthly_percent == 85.0
+
+    def test_returns_none_without_earlier_snapshot(self):
+        """Test that an empty result means there is no earlier snapshot."""
+        storage, _ = make_storage({"Items": []})
+        assert storage.get_latest_snapshot_before("2025-01-10", 0) is None
+
+
+class TestCountSnapshotsForDate:
+    """Tests for DynamoDBStorage.count_snapshots_for_date."""
+
+    def test_counts_without_fetching_items(self):
+        """Test that the query asks DynamoDB for a count only."""
+        storage, table = make_storage({"Count": 3, "ScannedCount": 3})
+
+        assert storage.count_snapshots_for_date("2025-01-10") == 3
+
+        (query,) = table.queries
+        assert query["KeyConditionExpression"] == Key("PK").eq("SNAPSHOT#2025-01-10")
+        assert query["Select"] == "COUNT"
+
+    def test_missing_count_is_zero(self):
+        """Test that a response without a count is treated as no snapshots."""
+        storage, _ = make_storage({})
+        assert storage.count_snapshots_for_date("2025-01-10") == 0